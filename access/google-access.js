@@ -6,6 +6,7 @@ const {
   GOOGLE_CLASSROOM_ASSIGNMENTS_PATH
 } = require('config/constants');
 const { showNotification } = require('core/notifications');
+const { checkScrapingCanceled } = require('scrapers/assignment-utils');
 
 
 /**
@@ -71,8 +72,6 @@ async function ensureGoogleAuthentication(browserView, accountNumber) {
       if (!currentUrl.includes('/a/not-turned-in/all')) {
         logToRenderer(`[GoogleC] Navigating to assigned URL for account /u/${accountNumber}...`, 'info');
         await browserView.webContents.loadURL(assignedUrl);
-        // Wait a moment for navigation to settle
-        await new Promise(resolve => setTimeout(resolve, 1000));
       }
       
       return { success: true, needsAuth: false };
@@ -115,8 +114,6 @@ async function ensureGoogleAuthentication(browserView, accountNumber) {
       if (!currentUrl.includes('/a/not-turned-in/all')) {
         logToRenderer(`[GoogleC] Navigating to assigned URL for account /u/${accountNumber}...`, 'info');
         await browserView.webContents.loadURL(assignedUrl);
-        // Wait a moment for navigation to settle
-        await new Promise(resolve => setTimeout(resolve, 1000));
       }
       
       return { success: true, needsAuth: false };
@@ -132,13 +129,24 @@ async function ensureGoogleAuthentication(browserView, accountNumber) {
 }
 
 /**
- * Check if scraping has been canceled
+ * Resolve on the next navigation of the webContents (including in-page ones),
+ * or after timeoutMs, whichever comes first
+ * @param {WebContents} webContents - The webContents to watch
+ * @param {number} timeoutMs - Longest to wait
+ * @returns {Promise<void>}
  */
-function checkScrapingCanceled() {
-  if (global.isScrapingCanceled && global.isScrapingCanceled()) {
-    logToRenderer('Authentication canceled by user', 'info');
-    throw new Error('Scraping canceled by user');
-  }
+function waitForNavigation(webContents, timeoutMs) {
+  return new Promise((resolve) => {
+    const done = () => {
+      clearTimeout(timer);
+      webContents.removeListener('did-navigate', done);
+      webContents.removeListener('did-navigate-in-page', done);
+      resolve();
+    };
+    const timer = setTimeout(done, timeoutMs);
+    webContents.on('did-navigate', done);
+    webContents.on('did-navigate-in-page', done);
+  });
 }
 
 /**
@@ -180,8 +188,8 @@ async function waitForAuthentication(browserView, accountType) {
     // Check for cancellation at the start of each loop iteration
     checkScrapingCanceled();
     
-    // Wait a bit before checking
-    await new Promise(resolve => setTimeout(resolve, 3000)); // 3 seconds
+    // Wait for the next navigation, or at most 3 seconds so cancellation is still noticed
+    await waitForNavigation(browserView.webContents, 3000);
     
     // Check for cancellation after waiting
     checkScrapingCanceled();
@@ -3,6 +3,36 @@
 const fs = require('fs');
 const { logToRenderer } = require('core/logger');
 const { JUPITER_SECRET_PATH, SECRETS_DIR, JUPITER_LOGIN_URL } = require('config/constants');
+const { waitForSelector, writeFileAtomic } = require('scrapers/assignment-utils');
+
+// Upper bound on waiting for the page that follows a login submit
+const LOGIN_NAVIGATION_TIMEOUT_MS = 5000;
+
+// Upper bound on waiting for the login page's follow-up load before filling the form
+const LOGIN_PAGE_LOAD_TIMEOUT_MS = 5000;
+
+// Matches only the logged-in student page: it has #mainpage (which holds the
+// To Do button) and, unlike the login page, no login button
+const JUPITER_STUDENT_PAGE_SELECTOR = 'body:not(:has(#loginbtn)) #mainpage';
+
+/**
+ * Wait for the next occurrence of a page load event, or give up after a timeout
+ * @param {WebContents} webContents - The web contents to watch
+ * @param {string} eventName - The event to wait for (e.g. 'dom-ready', 'did-finish-load')
+ * @param {number} timeoutMs - Maximum time to wait in milliseconds
+ * @returns {Promise<void>} - Resolves on the event or timeout
+ */
+function waitForPageEvent(webContents, eventName, timeoutMs) {
+  return new Promise((resolve) => {
+    const done = () => {
+      clearTimeout(timer);
+      webContents.removeListener(eventName, done);
+      resolve();
+    };
+    const timer = setTimeout(done, timeoutMs);
+    webContents.once(eventName, done);
+  });
+}
 
 /**
  * Ensure browser view is ready for Jupiter operations
@@ -29,7 +59,6 @@ async function checkJupiterCredentials() {
   logToRenderer('[Jupiter] Checking for credentials...', 'info');
   
   try {
-    await fs.promises.access(JUPITER_SECRET_PATH);
     const credentials = JSON.parse(await fs.promises.readFile(JUPITER_SECRET_PATH, 'utf8'));
     logToRenderer('Jupiter Ed credentials found: Logging in...', 'info');
     return { success: true, credentials };
@@ -49,7 +78,15 @@ async function saveJupiterCredentials(credentials) {
   
   try {
     // SECRETS_DIR should already exist from pre-scraping checks
-    await fs.promises.writeFile(JUPITER_SECRET_PATH, JSON.stringify(credentials), 'utf8');
+    const data = JSON.stringify(credentials);
+    const existing = await fs.promises.readFile(JUPITER_SECRET_PATH, 'utf8').catch(() => null);
+    if (existing === data) {
+      logToRenderer('Jupiter credentials unchanged.', 'info');
+      return { success: true, credentials };
+    }
+    
+    // Written atomically so an interrupted save can't leave a corrupt secrets file
+    await writeFileAtomic(JUPITER_SECRET_PATH, data);
     logToRenderer('Jupiter credentials saved successfully.', 'success');
     return { success: true, credentials };
   } catch (error) {
@@ -58,6 +95,21 @@ async function saveJupiterCredentials(credentials) {
   }
 }
 
+/**
+ * Check whether the loaded page is already a logged-in Jupiter page
+ * @param {BrowserView} browserView - The Electron BrowserView instance
+ * @returns {Promise<boolean>} - True if the student page (not the login form) is showing
+ */
+async function hasActiveJupiterSession(browserView) {
+  try {
+    return await browserView.webContents.executeJavaScript(
+      `!!document.querySelector(${JSON.stringify(JUPITER_STUDENT_PAGE_SELECTOR)})`
+    );
+  } catch (error) {
+    return false;
+  }
+}
+
 /**
  * Login to Jupiter Ed using credentials
  * @param {BrowserView} browserView - The Electron BrowserView instance
@@ -72,9 +124,20 @@ async function loginToJupiter(browserView, credentials, mainWindow) {
     // Ensure browser view is ready and navigate to login page
     await ensureJupiterBrowserReady(browserView, mainWindow);
     
+    // Listen for the login page's follow-up load before probing the session, so
+    // it can't finish unseen. On timeout the form is filled on the page as loaded
+    const loginPageLoaded = waitForPageEvent(browserView.webContents, 'did-finish-load', LOGIN_PAGE_LOAD_TIMEOUT_MS);
+    
+    // The default session keeps Jupiter's cookies, so a session from an earlier
+    // run lands on the student page instead of the login form
+    if (await hasActiveJupiterSession(browserView)) {
+      logToRenderer('[Jupiter] Existing session is still valid, skipping login form', 'success');
+      return { success: true, reusedSession: true };
+    }
+    
     // Wrap the entire login process in a Promise to make it awaitable
     return new Promise((resolve, reject) => {
-      browserView.webContents.once('did-finish-load', async () => {
+      loginPageLoaded.then(async () => {
       try {
         const loginType = credentials.loginType || 'student';
         const tabId = loginType === 'parent' ? 'tab_parent' : 'tab_student';
@@ -111,9 +174,14 @@ async function loginToJupiter(browserView, credentials, mainWindow) {
       logToRenderer('Tab click completed. Now attempting to enter credentials...', 'info');
       
       try {
-        // Wait a moment for the tab to switch
-        await new Promise(resolve => setTimeout(resolve, 500));
+        // Wait for the tab's login form to be present instead of sleeping
+        await waitForSelector(browserView.webContents, '#text_studid1', 2000);
         
+        // Embed credentials as JS string literals so quotes or backslashes in them
+        // can't break out of (or inject into) the page scripts below
+        const studentNameLiteral = JSON.stringify(String(credentials.student_name || ''));
+        const passwordLiteral = JSON.stringify(String(credentials.password || ''));
+
         // Enter the student name in the contenteditable div
         logToRenderer('Entering student name...', 'info');
         const studentNameResult = await browserView.webContents.executeJavaScript(`
@@ -122,15 +190,15 @@ async function loginToJupiter(browserView, credentials, mainWindow) {
             const hiddenInput = document.querySelector('input[name="studid1"]');
             
             if (studentDiv) {
-              studentDiv.textContent = '${credentials.student_name}';
+              studentDiv.textContent = ${studentNameLiteral};
               if (hiddenInput) {
-                hiddenInput.value = '${credentials.student_name}';
+                hiddenInput.value = ${studentNameLiteral};
               }
               // Hide the placeholder
               const placeholder = document.getElementById('ph_studid1');
               if (placeholder) placeholder.style.display = 'none';
               
-              resolve({ success: true, field: 'student_name', value: '${credentials.student_name}' });
+              resolve({ success: true, field: 'student_name', value: ${studentNameLiteral} });
             } else {
               resolve({ success: false, error: 'Student name field not found' });
             }
@@ -146,7 +214,7 @@ async function loginToJupiter(browserView, credentials, mainWindow) {
             const passwordField = document.getElementById('text_password1');
             
             if (passwordField) {
-              passwordField.value = '${credentials.password}';
+              passwordField.value = ${passwordLiteral};
               resolve({ success: true, field: 'password' });
             } else {
               resolve({ success: false, error: 'Password field not found' });
@@ -156,8 +224,10 @@ async function loginToJupiter(browserView, credentials, mainWindow) {
         
         logToRenderer(`Password entry result: ${JSON.stringify(passwordResult)}`, passwordResult.success ? 'info' : 'error');
         
-        // Click the login button with mouse simulation
+        // Click the login button with mouse simulation, listening for the
+        // resulting page load before the click so it can't be missed
         logToRenderer('Simulating click on login button...', 'info');
+        const loginNavigation = waitForPageEvent(browserView.webContents, 'dom-ready', LOGIN_NAVIGATION_TIMEOUT_MS);
         const loginButtonResult = await browserView.webContents.executeJavaScript(`
           new Promise((resolve) => {
             const loginBtn = document.getElementById('loginbtn');
@@ -185,10 +255,18 @@ async function loginToJupiter(browserView, credentials, mainWindow) {
         
         if (loginButtonResult.success) {
           logToRenderer('Login form submitted.', 'info');
-          // Wait for potential redirect
-          await new Promise(resolve => setTimeout(resolve, 500));
+          // Wait for the post-login page's DOM rather than a fixed delay
+          await loginNavigation;
+          
+          // Same check as the session probe, so a slow submit or a rejected login
+          // still showing the form doesn't count as logged in
+          const reachedStudentPage = await waitForSelector(browserView.webContents, JUPITER_STUDENT_PAGE_SELECTOR, LOGIN_NAVIGATION_TIMEOUT_MS);
+          if (!reachedStudentPage) {
+            logToRenderer(`Jupiter Ed login did not reach the student page (at ${browserView.webContents.getURL()})`, 'error');
+            resolve({ success: false, error: 'Login did not reach the student page' });
+            return;
+          }
           
-          const finalUrl = browserView.webContents.getURL();
           logToRenderer('Jupiter Ed login completed successfully!', 'success');
           logToRenderer('Saving credentials...', 'info');
           
@@ -106,10 +106,13 @@ const BACKUPS_DIR = path.join(DATA_DIR, 'backups');
 const ASSIGNMENTS_FILE = path.join(DATA_DIR, 'all_assignments.json');
 const LOG_FILE = path.join(TEMP_DIR, 'app.log');
 const APP_SETTINGS_FILE = path.join(DATA_DIR, 'app_settings.json');
+const ASSIGNMENT_DETAILS_CACHE_FILE = path.join(TEMP_DIR, 'assignment_details_cache.json');
 
 // Google Classroom configuration
 const GOOGLE_CLASSROOM_URL_BASE = 'https://classroom.google.com/u/';
 const GOOGLE_CLASSROOM_ASSIGNMENTS_PATH = '/a/not-turned-in/all';
+const GOOGLE_CLASSROOM_MISSING_PATH = '/a/missing/all';
+const GOOGLE_CLASSROOM_DONE_PATH = '/a/turned-in/all';
 
 // Jupiter Ed configuration
 const JUPITER_LOGIN_URL = 'https://login.jupitered.com/login/index.php?89583';
@@ -124,6 +127,9 @@ const BROWSER_VIEW_BOUNDS = {
   heightOffset: 240  // Full height minus logs pane (200px) and status bar (40px)
 };
 
+// Number of .course-color-N classes defined in main.css
+const COURSE_COLOR_COUNT = 15;
+
 module.exports = {
   APP_NAME,
   APP_NAME_SHORT,
@@ -151,10 +157,14 @@ module.exports = {
   ASSIGNMENTS_FILE,
   LOG_FILE,
   APP_SETTINGS_FILE,
+  ASSIGNMENT_DETAILS_CACHE_FILE,
   GOOGLE_CLASSROOM_URL_BASE,
   GOOGLE_CLASSROOM_ASSIGNMENTS_PATH,
+  GOOGLE_CLASSROOM_MISSING_PATH,
+  GOOGLE_CLASSROOM_DONE_PATH,
   JUPITER_LOGIN_URL,
   JUPITER_SECRET_PATH,
   JUPITER_CONFIG_PATH,
-  BROWSER_VIEW_BOUNDS
+  BROWSER_VIEW_BOUNDS,
+  COURSE_COLOR_COUNT
 };
\ No newline at end of file
@@ -1,7 +1,7 @@
 // Assignment Tracker JavaScript - handles display of assignment data
 const { ipcRenderer } = require('electron');
 const { logToRenderer } = require('./logger');
-const { DATA_DIR } = require('../config/constants');
+const { DATA_DIR, COURSE_COLOR_COUNT } = require('../config/constants');
 
 class AssignmentTracker {
     constructor() {
@@ -9,6 +9,7 @@ class AssignmentTracker {
         this.currentDate = new Date(); 
         this.currentMonth = new Date();
         this.classColorMap = new Map();
+        this.classColorMapChanged = true; // set by buildClassColorMap
         this.initialized = false;
         this.tooltipEl = null; // reusable tooltip element
     }
@@ -186,18 +187,26 @@ class AssignmentTracker {
     }
 
     buildClassColorMap() {
+        // One pass over the assignments, no per-item callback
         const classNames = new Set();
-        this.assignments.forEach(assignment => {
-            if (assignment.class) {
-                classNames.add(assignment.class);
-            }
-        });
+        for (const assignment of this.assignments) {
+            if (assignment.class) classNames.add(assignment.class);
+        }
+
+        // Same classes as last time - keep the existing colors and legend
+        if (classNames.size === this.classColorMap.size &&
+            Array.from(classNames).every(name => this.classColorMap.has(name))) {
+            this.classColorMapChanged = false;
+            return;
+        }
+        this.classColorMapChanged = true;
 
         const sortedNames = Array.from(classNames).sort();
         this.classColorMap.clear();
         
+        // Round-robin over the palette: each class gets its color in O(1)
         sortedNames.forEach((name, index) => {
-            const colorIndex = (index % 15) + 1;
+            const colorIndex = (index % COURSE_COLOR_COUNT) + 1;
             this.classColorMap.set(name, `course-color-${colorIndex}`);
         });
     }
@@ -555,7 +564,9 @@ class AssignmentTracker {
         await this.loadAssignments();
         this.renderCalendar();
         this.renderAssignmentLists();
-        this.renderClassLegend();
+        if (this.classColorMapChanged) {
+            this.renderClassLegend();
+        }
         this.updateStatistics();
         this.updateLastUpdated();
         
@@ -591,7 +602,9 @@ class AssignmentTracker {
                 if (!a.due_date_parsed && !b.due_date_parsed) return 0;
                 if (!a.due_date_parsed) return 1;
                 if (!b.due_date_parsed) return -1;
-                comparison = new Date(a.due_date_parsed) - new Date(b.due_date_parsed);
+                // due_date_parsed is an ISO timestamp, so string order is date order
+                if (a.due_date_parsed < b.due_date_parsed) comparison = -1;
+                else if (a.due_date_parsed > b.due_date_parsed) comparison = 1;
             }
             
             return reverse ? -comparison : comparison;
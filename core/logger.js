@@ -11,45 +11,104 @@ let logsWindow = null;
 
 // LOG_FILE is now imported from constants.js
 
+// Pending log lines, written to disk in one append per flush
+const LOG_FLUSH_DELAY_MS = 250;
+const MAX_LOG_LINES = 1500;
+// Lines allowed past MAX_LOG_LINES before truncating, so not every flush rewrites the file
+const LOG_TRUNCATE_SLACK_LINES = 500;
+let logBuffer = [];
+let flushTimer = null;
+let logDirReady = false;
+// Lines currently in LOG_FILE; counted from the file on the first flush
+let logLineCount = null;
+
+// Count newline characters in a string
+function countLines(text) {
+  let count = 0;
+  let index = text.indexOf('\n');
+  while (index !== -1) {
+    count++;
+    index = text.indexOf('\n', index + 1);
+  }
+  return count;
+}
+
 // Helper function to write to log file
 function writeToLogFile(message, type, timestamp) {
+  // Skip if LOG_FILE is not set yet (during initialization)
+  if (!LOG_FILE) {
+    return;
+  }
+  
+  logBuffer.push(`[${timestamp}] [${type.toUpperCase()}] ${message}\n`);
+  
+  if (!flushTimer) {
+    flushTimer = setTimeout(flushLogFile, LOG_FLUSH_DELAY_MS);
+  }
+}
+
+// Write any buffered log lines to the log file
+function flushLogFile() {
+  if (flushTimer) {
+    clearTimeout(flushTimer);
+    flushTimer = null;
+  }
+  
+  if (!LOG_FILE || logBuffer.length === 0) {
+    return;
+  }
+  
+  const pending = logBuffer.join('');
+  logBuffer = [];
+  
   try {
-    // Skip if LOG_FILE is not set yet (during initialization)
-    if (!LOG_FILE) {
-      return;
+    // Ensure the log directory exists
+    if (!logDirReady) {
+      fs.mkdirSync(path.dirname(LOG_FILE), { recursive: true });
+      logDirReady = true;
     }
     
-    // Ensure the log directory exists
-    const logDir = path.dirname(LOG_FILE);
-    if (!fs.existsSync(logDir)) {
-      fs.mkdirSync(logDir, { recursive: true });
+    if (logLineCount === null) {
+      logLineCount = fs.existsSync(LOG_FILE) ? countLines(fs.readFileSync(LOG_FILE, 'utf8')) : 0;
     }
     
-    const logEntry = `[${timestamp}] [${type.toUpperCase()}] ${message}\n`;
-    fs.appendFileSync(LOG_FILE, logEntry, 'utf8');
+    fs.appendFileSync(LOG_FILE, pending, 'utf8');
+    logLineCount += countLines(pending);
     
-    // Truncate log file if it gets too large (keep last 1500 lines)
-    truncateLogFile();
+    // Truncate log file once it has grown well past the limit (keep last 1500 lines)
+    if (logLineCount > MAX_LOG_LINES + LOG_TRUNCATE_SLACK_LINES) {
+      truncateLogFile();
+    }
   } catch (error) {
     console.error('Failed to write to log file:', error);
   }
 }
 
+// Don't lose buffered lines when the app quits
+process.on('exit', flushLogFile);
+
 // Helper function to truncate log file to last 1500 lines
 function truncateLogFile() {
   try {
-    // Only truncate occasionally to avoid performance issues
-    if (Math.random() < 0.01) { // 1% chance on each write
-      if (fs.existsSync(LOG_FILE)) {
-        const logContent = fs.readFileSync(LOG_FILE, 'utf8');
-        const lines = logContent.split('\n');
-        
-        if (lines.length > 1500) {
-          const lastLines = lines.slice(-1500); // Keep last 1500 lines
-          fs.writeFileSync(LOG_FILE, lastLines.join('\n'), 'utf8');
-          console.log(`Log file truncated to ${lastLines.length} lines`);
-        }
+    if (fs.existsSync(LOG_FILE)) {
+      const logContent = fs.readFileSync(LOG_FILE, 'utf8');
+      
+      // Walk back from the end to the 1500th newline instead of splitting every line
+      let cutIndex = logContent.length;
+      let newlines = 0;
+      while (newlines < MAX_LOG_LINES && cutIndex > 0) {
+        cutIndex = logContent.lastIndexOf('\n', cutIndex - 1);
+        if (cutIndex === -1) break;
+        newlines++;
+      }
+      
+      if (newlines === MAX_LOG_LINES) {
+        fs.writeFileSync(LOG_FILE, logContent.slice(cutIndex + 1), 'utf8'); // Keep last 1500 lines
+        console.log(`Log file truncated to ${MAX_LOG_LINES} lines`);
       }
+      logLineCount = newlines;
+    } else {
+      logLineCount = 0;
     }
   } catch (error) {
     console.error('Failed to truncate log file:', error);
@@ -143,5 +202,6 @@ function logToRenderer(message, type = 'info') {
 module.exports = {
   initializeLogger,
   logToRenderer,
-  setLogsWindow
+  setLogsWindow,
+  flushLogFile
 };
\ No newline at end of file
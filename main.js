@@ -12,7 +12,7 @@ const { BROWSER_VIEW_BOUNDS, ASSIGNMENTS_FILE, APP_SETTINGS_FILE, JUPITER_LOGIN_
 const { runStartupValidation } = require('core/validation_startup');
 
 // STEP 3: Import logger (but don't initialize it yet)
-const { initializeLogger, logToRenderer, setLogsWindow } = require('core/logger');
+const { initializeLogger, logToRenderer, setLogsWindow, flushLogFile } = require('core/logger');
 
 // Import access modules
 const { handleJupiterAccess, saveJupiterCredentials, loginToJupiter } = require('access/jupiter-access');
@@ -22,7 +22,7 @@ const { handleGoogleSheetsAccess } = require('access/googlesheets_access');
 const { scrapeGoogleClassroomAssignments, convertToStandardFormat: convertGoogleAssignments } = require('scrapers/google-classroom-scraper');
 const { scrapeJupiterAssignments, convertToStandardFormat: convertJupiterAssignments } = require('scrapers/jupiter-scraper');
 const { scrapeGoogleSheets } = require('scrapers/googlesheets-scraper');
-const { saveAssignments } = require('scrapers/assignment-utils');
+const { saveAssignments, mergeSortedAssignments, writeFileAtomic } = require('scrapers/assignment-utils');
 
 // Import validation modules
 const AssignmentBackup = require('core/assignment-backup');
@@ -47,6 +47,7 @@ const backupSystem = new AssignmentBackup();
 let mainWindow;
 let settingsWindow;
 let browserView; // Single browser view for all scraping operations
+let jupiterBrowserView = null; // Hidden view used while Jupiter runs alongside Google
 let isScrapingCanceled = false;
 let scrapingTimeout = null; // Timeout reference for scraping process
 let systemTray = null; // System tray reference
@@ -249,8 +250,12 @@ async function initializeApp() {
   }
 }
 
-// Set remote debugging port to 19090 to avoid conflicts with default 9090
-app.commandLine.appendSwitch('remote-debugging-port', '19090');
+// Set remote debugging port to 19090 to avoid conflicts with default 9090.
+// Only in development: it's a debugging aid, and leaving the DevTools protocol
+// server open in normal runs costs startup work and exposes the logged-in session.
+if (process.env.NODE_ENV === 'development') {
+  app.commandLine.appendSwitch('remote-debugging-port', '19090');
+}
 
 // This method will be called when Electron has finished initialization
 app.whenReady().then(() => {
@@ -336,6 +341,7 @@ async function withTimeout(promise, timeoutMs, operationName) {
         mainWindow.setBrowserView(null);
         browserView = null;
       }
+      closeJupiterBrowserView();
       
       reject(new Error(`Scraping operation timed out after ${timeoutMs / 1000 / 60} minutes`));
     }, timeoutMs);
@@ -355,6 +361,10 @@ async function withTimeout(promise, timeoutMs, operationName) {
 function createBrowserView() {
   if (!browserView) {
     logToRenderer('Creating new BrowserView', 'info');
+    // No partition is set, so this uses the app's default session, which Electron
+    // keeps on disk under userData: Google cookies, localStorage and IndexedDB
+    // survive restarts and logins don't have to be replayed. Don't switch this to
+    // an in-memory partition or clear its storage between runs.
     browserView = new BrowserView({
       webPreferences: {
         nodeIntegration: false,
@@ -463,6 +473,61 @@ function createBrowserView() {
   }
 }
 
+// Create a hidden BrowserView for Jupiter so it can scrape while the
+// main view is busy with Google Classroom
+function createJupiterBrowserView() {
+  closeJupiterBrowserView();
+  
+  logToRenderer('[Jupiter] Creating background BrowserView', 'info');
+  jupiterBrowserView = new BrowserView({
+    webPreferences: {
+      nodeIntegration: false,
+      contextIsolation: true,
+      allowRunningInsecureContent: false,
+      experimentalFeatures: false,
+      // Never attached to the window, so don't let Chromium throttle its timers
+      backgroundThrottling: false,
+      // Only DOM text is read from Jupiter, so skip subsystems a hidden scrape never uses
+      images: false,
+      webgl: false,
+      spellcheck: false
+    }
+  });
+  jupiterBrowserView.webContents.setAudioMuted(true);
+  
+  const { width, height } = mainWindow.getBounds();
+  jupiterBrowserView.setBounds({ 
+    x: BROWSER_VIEW_BOUNDS.x,
+    y: BROWSER_VIEW_BOUNDS.y,
+    width: width - BROWSER_VIEW_BOUNDS.widthOffset,
+    height: height - BROWSER_VIEW_BOUNDS.heightOffset
+  });
+  
+  // Keep navigation inside the view, same as the main browser view
+  jupiterBrowserView.webContents.setWindowOpenHandler(({ url }) => {
+    jupiterBrowserView.webContents.loadURL(url);
+    return { action: 'deny' };
+  });
+  
+  jupiterBrowserView.webContents.on('did-fail-load', (event, errorCode, errorDescription, validatedURL) => {
+    logToRenderer(`[Jupiter] Navigation failed for ${validatedURL}: ${errorDescription}`, 'error');
+  });
+  
+  return jupiterBrowserView;
+}
+
+// Destroy the background Jupiter view (if any)
+function closeJupiterBrowserView(view = jupiterBrowserView) {
+  if (!view) return;
+  
+  if (view.webContents && !view.webContents.isDestroyed()) {
+    view.webContents.close();
+  }
+  if (view === jupiterBrowserView) {
+    jupiterBrowserView = null;
+  }
+}
+
 // Keep reference to logs window
 let logsWindow;
 
@@ -509,7 +574,8 @@ function createLogsWindow() {
   logToRenderer('Logs window created', 'info');
 }
 
-// No need for multiple browser views - we'll use the single browserView sequentially
+// Google and Sheets share the single browserView sequentially; Jupiter can
+// run at the same time in its own background view (see createJupiterBrowserView)
 
 // Complete workflow: Google Classroom direct load + scrape
 // @param {number} accountNumber - The account number (0 or 1)
@@ -551,24 +617,28 @@ async function runGoogleWorkflow(accountNumber) {
 }
 
 // Complete workflow: Jupiter access + scraping
-async function runJupiterWorkflow() {
+// @param {BrowserView} [view] - View to scrape in; defaults to the shared browserView
+async function runJupiterWorkflow(view = null) {
   logToRenderer('Starting Jupiter Ed workflow...', 'info');
   
   try {
     // Check for cancellation before starting
     checkScrapingCanceled();
     
-    // Step 1: Setup Jupiter browser
-    const setupResult = await setupJupiterBrowser();
-    if (!setupResult.success) {
-      return { success: false, error: setupResult.error, assignments: [] };
+    // Step 1: Setup Jupiter browser (only needed when using the shared view)
+    if (!view) {
+      const setupResult = await setupJupiterBrowser();
+      if (!setupResult.success) {
+        return { success: false, error: setupResult.error, assignments: [] };
+      }
     }
+    const jupiterView = view || browserView;
     
     // Check for cancellation after setup
     checkScrapingCanceled();
     
     // Step 2: Authenticate with Jupiter (credentials guaranteed to exist from pre-checks)
-    const accessResult = await handleJupiterAccess(browserView, mainWindow);
+    const accessResult = await handleJupiterAccess(jupiterView, mainWindow);
     if (!accessResult.success) {
       return { success: false, error: 'Jupiter access failed', assignments: [] };
     }
@@ -577,7 +647,7 @@ async function runJupiterWorkflow() {
     checkScrapingCanceled();
     
     // Step 2: Scrape assignments from Jupiter
-    const scrapingResult = await scrapeJupiterAssignments(browserView);
+    const scrapingResult = await scrapeJupiterAssignments(jupiterView);
     
     logToRenderer(`Jupiter workflow completed: ${scrapingResult.success ? 'Success' : 'Failed'}`, 
                   scrapingResult.success ? 'success' : 'error');
@@ -671,12 +741,15 @@ async function setupJupiterBrowser() {
 async function processWorkflowResults(google0Result, google1Result, jupiterResult, sheetsResult) {
   let allAssignments = [];
   let totalGoogleAssignments = 0;
+  // Each scraper returns its assignments sorted by due date; collect the
+  // per-source lists and merge them once at the end
+  const sourceLists = [];
   
   try {
     // Process Google /u/0 results
     if (google0Result.success) {
       const standardized0 = await convertGoogleAssignments(google0Result.assignments);
-      allAssignments.push(...standardized0);
+      sourceLists.push(standardized0);
       totalGoogleAssignments += standardized0.length;
       logToRenderer(`Collected ${standardized0.length} assignments from Google /u/0`, 'success');
     } else {
@@ -686,7 +759,7 @@ async function processWorkflowResults(google0Result, google1Result, jupiterResul
     // Process Google /u/1 results  
     if (google1Result.success) {
       const standardized1 = await convertGoogleAssignments(google1Result.assignments);
-      allAssignments.push(...standardized1);
+      sourceLists.push(standardized1);
       totalGoogleAssignments += standardized1.length;
       logToRenderer(`Collected ${standardized1.length} assignments from Google /u/1`, 'success');
     } else {
@@ -696,7 +769,7 @@ async function processWorkflowResults(google0Result, google1Result, jupiterResul
     // Process Jupiter results
     if (jupiterResult.success) {
       const standardizedJupiter = await convertJupiterAssignments(jupiterResult.assignments);
-      allAssignments.push(...standardizedJupiter);
+      sourceLists.push(standardizedJupiter);
       logToRenderer(`Collected ${standardizedJupiter.length} Jupiter Ed assignments`, 'success');
     } else {
       logToRenderer(`Jupiter workflow failed: ${jupiterResult.error}`, 'warn');
@@ -705,12 +778,14 @@ async function processWorkflowResults(google0Result, google1Result, jupiterResul
     // Process Google Sheets results
     if (sheetsResult && sheetsResult.success) {
       // Google Sheets assignments are already in standardized format
-      allAssignments.push(...sheetsResult.assignments);
+      sourceLists.push(sheetsResult.assignments);
       logToRenderer(`Collected ${sheetsResult.assignments.length} Google Sheets assignments`, 'success');
     } else if (sheetsResult) {
       logToRenderer(`Google Sheets workflow failed: ${sheetsResult.error}`, 'warn');
     }
     
+    allAssignments = mergeSortedAssignments(sourceLists);
+    
     // Step 1: Load previous data for comparison FIRST
     logToRenderer('Loading previous data for comparison...', 'info');
     const previousData = backupSystem.loadMostRecentBackup();
@@ -741,7 +816,6 @@ async function processWorkflowResults(google0Result, google1Result, jupiterResul
         google0Assignments: google0Result.success ? google0Result.assignments.length : 0,
         google1Assignments: google1Result.success ? google1Result.assignments.length : 0,
         jupiterAssignments: jupiterResult.success ? jupiterResult.assignments.length : 0,
-        assignments: allAssignments,
         integratedWorkflows: true
       };
     } else {
@@ -782,23 +856,25 @@ async function processWorkflowResults(google0Result, google1Result, jupiterResul
         const finalResults = await backupSystem.mergeFromBackup(scrapingResults, sourcesToRestore);
         
         // Rebuild allAssignments with merged data
-        allAssignments = [];
+        const mergedLists = [];
         
         if (finalResults.google0Result && finalResults.google0Result.success) {
           const standardizedGoogle0 = await convertGoogleAssignments(finalResults.google0Result.assignments);
-          allAssignments.push(...standardizedGoogle0);
+          mergedLists.push(standardizedGoogle0);
         }
         
         if (finalResults.google1Result && finalResults.google1Result.success) {
           const standardizedGoogle1 = await convertGoogleAssignments(finalResults.google1Result.assignments);
-          allAssignments.push(...standardizedGoogle1);
+          mergedLists.push(standardizedGoogle1);
         }
         
         if (finalResults.jupiterResult && finalResults.jupiterResult.success) {
           const standardizedJupiter = await convertJupiterAssignments(finalResults.jupiterResult.assignments);
-          allAssignments.push(...standardizedJupiter);
+          mergedLists.push(standardizedJupiter);
         }
         
+        allAssignments = mergeSortedAssignments(mergedLists);
+        
         logToRenderer(`Rebuilt assignments with backup data: ${allAssignments.length} total assignments`, 'success');
       }
     }
@@ -829,19 +905,19 @@ async function processWorkflowResults(google0Result, google1Result, jupiterResul
     // Switch back to main browser view
     setActiveBrowserView('main');
     
+    // Only counts go back over IPC - the renderer reloads the assignments from the saved file
     return {
       success: true,
       totalAssignments: allAssignments.length,
       google0Assignments: google0Result.success ? google0Result.assignments.length : 0,
       google1Assignments: google1Result.success ? google1Result.assignments.length : 0,
       jupiterAssignments: jupiterResult.success ? jupiterResult.assignments.length : 0,
-      assignments: allAssignments,
       integratedWorkflows: true
     };
     
   } catch (error) {
     logToRenderer(`Error processing workflow results: ${error.message}`, 'error');
-    return { success: false, error: error.message, assignments: allAssignments };
+    return { success: false, error: error.message };
   }
 }
 
@@ -964,13 +1040,21 @@ async function runScrapingProcess() {
     // Ensure we have a browser view
     createBrowserView();
     
-    logToRenderer('Running sequential workflows: Google /u/0, then Google /u/1, then Jupiter...', 'info');
+    logToRenderer('Running workflows: Jupiter in the background while Google /u/0, then Google /u/1 run, then Google Sheets...', 'info');
     
     // Show browser view initially
     setActiveBrowserView('main');
     
+    // Jupiter doesn't share anything with the Google workflows, so start it now in
+    // its own hidden view and collect the result after the Google workflows finish
+    let jupiterPromise;
+    if (appSettings.scrape_jupiter) {
+      logToRenderer('Starting Jupiter workflow in the background...', 'info');
+      const jupiterView = createJupiterBrowserView();
+      jupiterPromise = runJupiterWorkflow(jupiterView).finally(() => closeJupiterBrowserView(jupiterView));
+    }
     
-    // Run all workflows sequentially (not in parallel)
+    // Google workflows share the main browser view, so they run one at a time
     const results = [];
     let google0Result;
     let google1Result;
@@ -1009,16 +1093,17 @@ async function runScrapingProcess() {
       results.push({ type: 'google1', result: google1Result });
     }
     
-    // Run Jupiter workflow (if enabled)
-    if (appSettings.scrape_jupiter) {
-      // Check if canceled before Jupiter
+    // Collect the Jupiter workflow result (if enabled)
+    if (jupiterPromise) {
+      logToRenderer('Waiting for Jupiter workflow to finish...', 'info');
+      const jupiterResult = await jupiterPromise;
+      
+      // Check if canceled while Jupiter was running
       if (isScrapingCanceled) {
         logToRenderer('Assignment update canceled by user', 'info');
         return { success: false, error: 'Assignment Update Canceled' };
       }
       
-      logToRenderer('Running Jupiter workflow...', 'info');
-      const jupiterResult = await runJupiterWorkflow();
       results.push({ type: 'jupiter', result: jupiterResult });
     } else {
       logToRenderer('Skipping Jupiter workflow (disabled in settings)', 'info');
@@ -1080,13 +1165,7 @@ async function markScrapingFailure(errorMessage) {
       lastFailureReason: errorMessage
     };
     
-    const updatedSettings = {
-      ...settings,
-      ...failureData,
-      last_updated: new Date().toISOString()
-    };
-    
-    await fs.promises.writeFile(APP_SETTINGS_FILE, JSON.stringify(updatedSettings, null, 2));
+    await writeAppSettings({ ...settings, ...failureData });
     logToRenderer(`Scraping failure tracked: ${errorMessage}`, 'info');
   } catch (error) {
     logToRenderer(`Error tracking scraping failure: ${error.message}`, 'error');
@@ -1102,13 +1181,7 @@ async function markScrapingSuccess() {
       lastSuccessTime: new Date().toISOString()
     };
     
-    const updatedSettings = {
-      ...settings,
-      ...successData,
-      last_updated: new Date().toISOString()
-    };
-    
-    await fs.promises.writeFile(APP_SETTINGS_FILE, JSON.stringify(updatedSettings, null, 2));
+    await writeAppSettings({ ...settings, ...successData });
     logToRenderer('Scraping success tracked', 'info');
   } catch (error) {
     logToRenderer(`Error tracking scraping success: ${error.message}`, 'error');
@@ -1167,12 +1240,10 @@ ipcMain.handle('get-jupiter-credentials', async () => {
     const fs = require('fs');
     const { JUPITER_SECRET_PATH } = require('config/constants');
     
-    if (fs.existsSync(JUPITER_SECRET_PATH)) {
-      const credentials = JSON.parse(fs.readFileSync(JUPITER_SECRET_PATH, 'utf8'));
-      return credentials;
-    }
-    return null;
+    const credentials = JSON.parse(fs.readFileSync(JUPITER_SECRET_PATH, 'utf8'));
+    return credentials;
   } catch (error) {
+    if (error.code === 'ENOENT') return null;
     logToRenderer(`Error loading Jupiter credentials: ${error.message}`, 'error');
     return null;
   }
@@ -1183,12 +1254,10 @@ ipcMain.handle('get-jupiter-config', async () => {
     const fs = require('fs');
     const { JUPITER_CONFIG_PATH } = require('config/constants');
     
-    if (fs.existsSync(JUPITER_CONFIG_PATH)) {
-      const config = JSON.parse(fs.readFileSync(JUPITER_CONFIG_PATH, 'utf8'));
-      return config;
-    }
-    return null;
+    const config = JSON.parse(fs.readFileSync(JUPITER_CONFIG_PATH, 'utf8'));
+    return config;
   } catch (error) {
+    if (error.code === 'ENOENT') return null;
     logToRenderer(`Error loading Jupiter config: ${error.message}`, 'error');
     return null;
   }
@@ -1274,7 +1343,6 @@ ipcMain.handle('load-jupiter-classes', async () => {
 
 ipcMain.handle('save-jupiter-config', async (event, classes) => {
   try {
-    const fs = require('fs');
     const { JUPITER_CONFIG_PATH } = require('config/constants');
     
     // Add timestamp to the config
@@ -1283,7 +1351,7 @@ ipcMain.handle('save-jupiter-config', async (event, classes) => {
       last_updated: new Date().toISOString()
     };
     
-    fs.writeFileSync(JUPITER_CONFIG_PATH, JSON.stringify(config, null, 2));
+    await writeFileAtomic(JUPITER_CONFIG_PATH, JSON.stringify(config, null, 2));
     logToRenderer('Jupiter configuration saved successfully', 'info');
     return { success: true };
   } catch (error) {
@@ -1312,33 +1380,56 @@ ipcMain.handle('delete-jupiter-credentials', async () => {
 });
 
 
+// Parsed app settings, reused until the file's modification time changes
+let appSettingsCache = { mtimeMs: 0, settings: null };
+
+// Read app settings from disk, skipping the read/parse when the file is unchanged.
+// Throws (ENOENT etc.) like readFileSync when the file can't be read.
+function readAppSettingsFile() {
+  const { mtimeMs } = fs.statSync(APP_SETTINGS_FILE);
+  if (!appSettingsCache.settings || appSettingsCache.mtimeMs !== mtimeMs) {
+    appSettingsCache = {
+      mtimeMs,
+      settings: JSON.parse(fs.readFileSync(APP_SETTINGS_FILE, 'utf8'))
+    };
+  }
+  // Hand out a copy so callers can't modify the cached object
+  return { ...appSettingsCache.settings };
+}
+
+// Write app settings with a fresh last_updated timestamp. The file is replaced
+// atomically, and the cache is primed with what was written so the next read
+// doesn't have to parse it back.
+async function writeAppSettings(settings) {
+  const settingsWithTimestamp = {
+    ...settings,
+    last_updated: new Date().toISOString()
+  };
+  
+  await writeFileAtomic(APP_SETTINGS_FILE, JSON.stringify(settingsWithTimestamp, null, 2));
+  const { mtimeMs } = await fs.promises.stat(APP_SETTINGS_FILE);
+  appSettingsCache = { mtimeMs, settings: settingsWithTimestamp };
+}
+
 // Helper function to get app settings
 async function getAppSettings() {
   try {
-    if (fs.existsSync(APP_SETTINGS_FILE)) {
-      const settings = JSON.parse(fs.readFileSync(APP_SETTINGS_FILE, 'utf8'));
-      return settings;
-    } else {
-      // Return default settings
-      return {
-        scrape_nyc_students_google: true,
-        scrape_hsmse_google: true,
-        scrape_geometry_calendar: true,
-        scrape_jupiter: true,
-        // Default scheduling settings
-        schedule_enabled: false,
-        schedule_time: '15:30' // 3:30 PM default
-      };
-    }
+    const settings = readAppSettingsFile();
+    return settings;
   } catch (error) {
-    logToRenderer(`Error loading app settings: ${error.message}`, 'error');
+    // A missing file just means no settings have been saved yet
+    if (error.code !== 'ENOENT') {
+      logToRenderer(`Error loading app settings: ${error.message}`, 'error');
+    }
+    // Return default settings
     return {
       scrape_nyc_students_google: true,
       scrape_hsmse_google: true,
       scrape_geometry_calendar: true,
       scrape_jupiter: true,
+      // Default scheduling settings
       schedule_enabled: false,
-      schedule_time: '15:30'
+      schedule_time: '15:30' // 3:30 PM default
     };
   }
 }
@@ -1503,10 +1594,10 @@ async function checkForFailureAlerts() {
 // App Settings IPC Handlers
 ipcMain.handle('get-app-settings', async () => {
   try {
-    if (fs.existsSync(APP_SETTINGS_FILE)) {
-      const settings = JSON.parse(fs.readFileSync(APP_SETTINGS_FILE, 'utf8'));
-      return settings;
-    } else {
+    const settings = readAppSettingsFile();
+    return settings;
+  } catch (error) {
+    if (error.code === 'ENOENT') {
       // Return default settings
       return {
         scrape_nyc_students_google: true,
@@ -1515,7 +1606,6 @@ ipcMain.handle('get-app-settings', async () => {
         scrape_jupiter: true
       };
     }
-  } catch (error) {
     logToRenderer(`Error loading app settings: ${error.message}`, 'error');
     return {
       scrape_nyc_students_google: true,
@@ -1527,12 +1617,7 @@ ipcMain.handle('get-app-settings', async () => {
 
 ipcMain.handle('save-app-settings', async (event, settings) => {
   try {
-    const settingsWithTimestamp = {
-      ...settings,
-      last_updated: new Date().toISOString()
-    };
-    
-    await fs.promises.writeFile(APP_SETTINGS_FILE, JSON.stringify(settingsWithTimestamp, null, 2));
+    await writeAppSettings(settings);
     logToRenderer('App settings saved successfully', 'info');
     
     // Update scheduler if scheduling settings changed
@@ -1614,13 +1699,10 @@ ipcMain.handle('get-assignments-file-path', () => {
 ipcMain.handle('get-assignments', async () => {
   try {
     const fs = require('fs');
-    if (fs.existsSync(ASSIGNMENTS_FILE)) {
-      const data = fs.readFileSync(ASSIGNMENTS_FILE, 'utf8');
-      return JSON.parse(data);
-    } else {
-      return [];
-    }
+    const data = fs.readFileSync(ASSIGNMENTS_FILE, 'utf8');
+    return JSON.parse(data);
   } catch (error) {
+    if (error.code === 'ENOENT') return [];
     console.error(`Error loading assignments: ${error.message}`);
     return [];
   }
@@ -1670,6 +1752,8 @@ ipcMain.handle('open-logs-window', () => {
 
 // Handle getting log file path
 ipcMain.handle('get-log-file-path', () => {
+  // Make sure the logs window sees everything logged so far
+  flushLogFile();
   const { LOG_FILE } = require('config/constants');
   return LOG_FILE;
 });
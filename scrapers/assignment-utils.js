@@ -13,41 +13,272 @@ const MONTH_NAMES = [
   'jul', 'aug', 'sep', 'oct', 'nov', 'dec'
 ];
 
-function parseDueDate(dateStr) {
+// Single-pass equivalents of scanning the lists above with includes()
+const MONTH_PATTERN = new RegExp(MONTH_NAMES.join('|'));
+const WEEKDAY_PATTERN = new RegExp(`(${WEEKDAYS.join('|')})`);
+const WEEKDAY_INDEX = Object.fromEntries(WEEKDAYS.map((day, index) => [day, index]));
+
+// Strings that mean there is no due date
+const SKIP_PATTERN = /posted|no due date|unknown/;
+
+// Relative day words and their offset from today
+const RELATIVE_DAY_OFFSETS = { today: 0, yesterday: -1, tomorrow: 1 };
+const RELATIVE_DAY_PATTERN = /(today|yesterday|tomorrow)/;
+
+// Well-formed date shapes we see most often (ISO timestamps from saved data,
+// MM/DD/YYYY from toLocaleDateString). These can be handled without the
+// relative/weekday checks or the general Date string parser.
+const ISO_DATE_TIME_PATTERN = /^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(:\d{2}(\.\d{1,3})?)?(Z|[+-]\d{2}:\d{2})$/;
+const US_NUMERIC_DATE_PATTERN = /^(\d{1,2})\/(\d{1,2})\/(\d{4})$/;
+
+// Patterns used on every parseDueDate/cleanCourseName call
+const DATE_NUMBERS_PATTERN = /\b\d{1,2}[/\-]\d{1,2}|\b\d{1,2}\s*(st|nd|rd|th)?\s*,|\b\d{4}\b/;
+const TIME_ONLY_PATTERN = /^\s*\d{1,2}:\d{2}\s*(AM|PM)?\s*$/i;
+const WHITESPACE_PATTERN = /\s+/;
+const DIGIT_PATTERN = /\d/;
+
+// Helper function to check if scraping has been canceled
+function checkScrapingCanceled() {
+  // Access the global cancellation flag from main process
+  if (global.isScrapingCanceled && global.isScrapingCanceled()) {
+    throw new Error('Scraping canceled by user');
+  }
+}
+
+// Subresources the scrapers never look at. Stylesheets are left alone because
+// visibility checks (offsetParent) depend on layout.
+const BLOCKED_RESOURCE_TYPES = new Set(['image', 'font', 'media']);
+// Analytics and telemetry requests, blocked whatever their resource type
+const BLOCKED_URL_PATTERN = /^https?:\/\/([^/]*\.)?(google-analytics\.com|googletagmanager\.com|doubleclick\.net)\/|^https?:\/\/play\.google\.com\/log\b|\/gen_204\b/;
+// webContents ids that currently have resource blocking switched on
+const resourceBlockingIds = new Set();
+const sessionsWithBlocking = new WeakSet();
+
+/**
+ * Turns blocking of images, fonts, media and analytics requests on or off for
+ * one webContents.
+ * Other webContents on the same session (e.g. the app windows) are unaffected.
+ * @param {WebContents} webContents - The scraping view's webContents
+ * @param {boolean} enabled - Whether to block
+ */
+function setResourceBlocking(webContents, enabled) {
+  if (!webContents || webContents.isDestroyed()) return;
+  
+  const session = webContents.session;
+  if (!sessionsWithBlocking.has(session)) {
+    session.webRequest.onBeforeRequest((details, callback) => {
+      const cancel = resourceBlockingIds.has(details.webContentsId) &&
+                     (BLOCKED_RESOURCE_TYPES.has(details.resourceType) || BLOCKED_URL_PATTERN.test(details.url));
+      callback({ cancel });
+    });
+    sessionsWithBlocking.add(session);
+  }
+  
+  if (enabled) {
+    resourceBlockingIds.add(webContents.id);
+  } else {
+    resourceBlockingIds.delete(webContents.id);
+  }
+}
+
+/**
+ * Navigates a webContents and resolves once the new document's DOM is ready,
+ * without waiting for images, fonts and other subresources like loadURL does.
+ * @param {WebContents} webContents - The webContents to navigate
+ * @param {string} url - URL to load
+ * @param {number} timeoutMs - Resolve anyway after this long
+ * @returns {Promise<void>}
+ */
+function loadUrlEager(webContents, url, timeoutMs = 15000) {
+  return new Promise((resolve, reject) => {
+    let timer = null;
+    
+    const cleanup = () => {
+      clearTimeout(timer);
+      webContents.removeListener('dom-ready', onReady);
+      webContents.removeListener('did-fail-load', onFail);
+    };
+    const onReady = () => {
+      cleanup();
+      resolve();
+    };
+    const onFail = (event, errorCode, errorDescription, validatedURL, isMainFrame) => {
+      // -3 (ERR_ABORTED) just means the navigation was replaced, e.g. by a redirect
+      if (!isMainFrame || errorCode === -3) return;
+      cleanup();
+      reject(new Error(`Failed to load ${validatedURL}: ${errorDescription}`));
+    };
+    
+    webContents.on('dom-ready', onReady);
+    webContents.on('did-fail-load', onFail);
+    timer = setTimeout(onReady, timeoutMs);
+    
+    // Failures are reported through did-fail-load above
+    webContents.loadURL(url).catch(() => {});
+  });
+}
+
+/**
+ * Waits until an element matching the selector exists in the page.
+ * @param {WebContents} webContents - The webContents to check
+ * @param {string} selector - CSS selector to wait for
+ * @param {number} timeoutMs - How long to wait before giving up
+ * @returns {Promise<boolean>} - True if the element appeared, false on timeout
+ */
+function waitForSelector(webContents, selector, timeoutMs = 10000) {
+  return webContents.executeJavaScript(`
+    new Promise((resolve) => {
+      const selector = ${JSON.stringify(selector)};
+      if (document.querySelector(selector)) {
+        resolve(true);
+        return;
+      }
+      
+      const observer = new MutationObserver(() => {
+        if (document.querySelector(selector)) {
+          observer.disconnect();
+          clearTimeout(timer);
+          resolve(true);
+        }
+      });
+      observer.observe(document.documentElement, { childList: true, subtree: true });
+      
+      const timer = setTimeout(() => {
+        observer.disconnect();
+        resolve(false);
+      }, ${timeoutMs});
+    })
+  `);
+}
+
+/**
+ * Waits until the page's main thread goes idle (requestIdleCallback), so
+ * rendering kicked off by earlier clicks has had a chance to finish.
+ * @param {WebContents} webContents - The webContents to wait on
+ * @param {number} timeoutMs - Resolve anyway after this long
+ * @returns {Promise<boolean>} - True if the page went idle, false on timeout
+ */
+function waitForIdle(webContents, timeoutMs = 2000) {
+  return webContents.executeJavaScript(`
+    new Promise((resolve) => {
+      const timer = setTimeout(() => resolve(false), ${timeoutMs});
+      requestIdleCallback(() => {
+        clearTimeout(timer);
+        resolve(true);
+      }, { timeout: ${timeoutMs} });
+    })
+  `);
+}
+
+/**
+ * Runs an async function over a list with at most `limit` calls in flight,
+ * preserving the input order in the results.
+ * @param {Array} items - Items to process
+ * @param {number} limit - Maximum number of concurrent calls
+ * @param {Function} fn - Async function called with (item, index)
+ * @returns {Promise<Array>} - Results in the same order as items; rejects with the
+ *   first error, after which no further calls are started
+ */
+async function mapWithConcurrency(items, limit, fn) {
+  const results = new Array(items.length);
+  let nextIndex = 0;
+  // Set once any call throws: Promise.all has already rejected, so the other
+  // workers stop taking new items instead of doing work nobody will read
+  let failed = false;
+  
+  async function worker() {
+    while (!failed && nextIndex < items.length) {
+      const index = nextIndex++;
+      try {
+        results[index] = await fn(items[index], index);
+      } catch (error) {
+        failed = true;
+        throw error;
+      }
+    }
+  }
+  
+  const workers = [];
+  for (let i = 0; i < Math.min(limit, items.length); i++) {
+    workers.push(worker());
+  }
+  await Promise.all(workers);
+  
+  return results;
+}
+
+/**
+ * Tries to parse a date string that is already in one of the known shapes.
+ * @param {string} dateStr - The trimmed date string
+ * @param {number} currentYear - The current year, for range checking
+ * @returns {string|null} - ISO timestamp, or null if the string needs the full parser
+ */
+function tryFastParse(dateStr, currentYear) {
+  let parsed = null;
+
+  if (ISO_DATE_TIME_PATTERN.test(dateStr)) {
+    parsed = new Date(dateStr);
+  } else {
+    const match = US_NUMERIC_DATE_PATTERN.exec(dateStr);
+    if (match) {
+      const month = parseInt(match[1], 10);
+      const day = parseInt(match[2], 10);
+      parsed = new Date(parseInt(match[3], 10), month - 1, day);
+      // Date rolls out-of-range values over (13/45 would become a date next
+      // year), so anything that didn't round-trip goes to the full parser
+      if (month < 1 || month > 12 || parsed.getMonth() + 1 !== month || parsed.getDate() !== day) {
+        return null;
+      }
+    }
+  }
+
+  // Leave anything with a suspicious year to the full parser's year correction
+  if (!parsed || isNaN(parsed.getTime()) ||
+      parsed.getFullYear() < 2020 || parsed.getFullYear() > currentYear + 1) {
+    return null;
+  }
+
+  return formatDateTimeString(parsed);
+}
+
+/**
+ * Parses a scraped due date string into an ISO timestamp.
+ * @param {string} dateStr - The raw due date text
+ * @param {Date} today - Reference "now"; pass one Date when parsing a batch
+ * @returns {string|null} - ISO timestamp, or null if the string isn't a date
+ */
+function parseDueDate(dateStr, today = new Date()) {
   if (!dateStr || typeof dateStr !== 'string') return null;
   
   const lower = dateStr.toLowerCase().trim();
   
   // Skip non-date strings
-  if (['posted', 'no due date', 'unknown'].some(keyword => lower.includes(keyword))) {
+  if (SKIP_PATTERN.test(lower)) {
     return null;
   }
   
-  const today = new Date();
+  // Fast path for dates that are already well-formed
+  const fastParsed = tryFastParse(dateStr.trim(), today.getFullYear());
+  if (fastParsed) {
+    return fastParsed;
+  }
+  
   const currentYear = today.getFullYear();
   
   // Handle relative dates
-  if (lower.includes('today')) {
-    return formatDateTimeString(today);
-  }
-  if (lower.includes('yesterday')) {
-    const yesterday = new Date(today);
-    yesterday.setDate(today.getDate() - 1);
-    return formatDateTimeString(yesterday);
+  const relativeMatch = RELATIVE_DAY_PATTERN.exec(lower);
+  if (relativeMatch) {
+    const targetDate = new Date(today);
+    targetDate.setDate(today.getDate() + RELATIVE_DAY_OFFSETS[relativeMatch[1]]);
+    return formatDateTimeString(targetDate);
   }
-  if (lower.includes('tomorrow')) {
-    const tomorrow = new Date(today);
-    tomorrow.setDate(today.getDate() + 1);
-    return formatDateTimeString(tomorrow);
-  }
-  
-  // Check if this is weekday-only (no month names or date numbers)
-  const hasMonth = MONTH_NAMES.some(month => lower.includes(month));
-  const hasDateNumbers = /\b\d{1,2}[/\-]\d{1,2}|\b\d{1,2}\s*(st|nd|rd|th)?\s*,|\b\d{4}\b/.test(lower);
   
-  if (!hasMonth && !hasDateNumbers) {
-    const weekdayIndex = WEEKDAYS.findIndex(day => lower.includes(day));
-    if (weekdayIndex !== -1) {
+  // Check if this is weekday-only (no month names or date numbers).
+  // Most strings have no weekday, so only check months/numbers when one is found.
+  const weekdayMatch = WEEKDAY_PATTERN.exec(lower);
+  if (weekdayMatch) {
+    if (!MONTH_PATTERN.test(lower) && !DATE_NUMBERS_PATTERN.test(lower)) {
+      const weekdayIndex = WEEKDAY_INDEX[weekdayMatch[1]];
       const currentWeekday = today.getDay() === 0 ? 6 : today.getDay() - 1; // Convert to Monday=0
       let daysToAdd = weekdayIndex - currentWeekday;
       if (daysToAdd <= 0) daysToAdd += 7; // Next occurrence
@@ -59,8 +290,7 @@ function parseDueDate(dateStr) {
   }
   
   // Handle time-only strings (assume today)
-  const timeOnlyPattern = /^\s*\d{1,2}:\d{2}\s*(AM|PM)?\s*$/i;
-  if (timeOnlyPattern.test(dateStr)) {
+  if (TIME_ONLY_PATTERN.test(dateStr)) {
     const timeStr = dateStr.trim();
     const todayDateStr = today.toISOString().split('T')[0]; // YYYY-MM-DD
     const fullDateStr = `${todayDateStr} ${timeStr}`;
@@ -88,12 +318,11 @@ function parseDueDate(dateStr) {
         
         // Create a test date with current year
         const testDate = new Date(currentYear, month, date, hours, minutes);
-        const now = new Date();
         
         // If the assignment date is more than 6 months in the past, 
         // it's likely meant for next year
-        const monthsDiff = (now.getFullYear() - testDate.getFullYear()) * 12 + 
-                          (now.getMonth() - testDate.getMonth());
+        const monthsDiff = (today.getFullYear() - testDate.getFullYear()) * 12 + 
+                          (today.getMonth() - testDate.getMonth());
         
         if (monthsDiff > 6) {
           year = currentYear + 1;
@@ -133,12 +362,12 @@ function formatDateTimeString(date) {
 function cleanCourseName(courseName) {
   if (!courseName) return courseName;
   
-  const words = courseName.trim().split(/\s+/);
+  const words = courseName.trim().split(WHITESPACE_PATTERN);
   const cleanWords = [];
   
   for (const word of words) {
     // Check if word contains any digit
-    if (/\d/.test(word)) {
+    if (DIGIT_PATTERN.test(word)) {
       break; // Stop at first word with a digit
     }
     cleanWords.push(word);
@@ -148,9 +377,10 @@ function cleanCourseName(courseName) {
   return cleanWords.length > 0 ? cleanWords.join(' ') : courseName;
 }
 
-function createAssignmentObject(name, className, dueDate, url, description = '', maxPoints = 0) {
+// Parsed timestamp and display string for a raw due date
+function resolveDueDate(dueDate, now) {
   // Parse the due date for internal use
-  const parsed = parseDueDate(dueDate);
+  const parsed = parseDueDate(dueDate, now);
 
   // Prepare a user-friendly display value for the due date.
   // If we have a parsed ISO timestamp, convert to a local date string
@@ -169,6 +399,19 @@ function createAssignmentObject(name, className, dueDate, url, description = '',
     displayDue = dueDate && typeof dueDate === 'string' && dueDate.trim() ? dueDate.trim() : '';
   }
 
+  return { parsed, displayDue };
+}
+
+// dueDateCache is an optional Map of raw due date string -> resolved date, so a
+// batch only parses repeated dates once. Only share it between calls with the same now.
+function createAssignmentObject(name, className, dueDate, url, description = '', maxPoints = 0, now = new Date(), dueDateCache = null) {
+  let resolved = dueDateCache ? dueDateCache.get(dueDate) : undefined;
+  if (!resolved) {
+    resolved = resolveDueDate(dueDate, now);
+    if (dueDateCache) dueDateCache.set(dueDate, resolved);
+  }
+  const { parsed, displayDue } = resolved;
+
   return {
     name,
     class: cleanCourseName(className),
@@ -182,9 +425,88 @@ function createAssignmentObject(name, className, dueDate, url, description = '',
   };
 }
 
+/**
+ * Comparator for assignment objects by due_date_parsed (ISO strings sort in
+ * date order). Assignments without a due date go last.
+ * @param {Object} a - Assignment object
+ * @param {Object} b - Assignment object
+ * @returns {number} - Negative if a is due first, positive if b is due first
+ */
+function compareByDueDate(a, b) {
+  const aDue = a.due_date_parsed;
+  const bDue = b.due_date_parsed;
+  if (aDue === bDue) return 0;
+  if (!aDue) return 1;
+  if (!bDue) return -1;
+  return aDue < bDue ? -1 : 1;
+}
+
+/**
+ * Returns a copy of the assignments sorted by due date.
+ * @param {Array<Object>} assignments - Assignment objects
+ * @returns {Array<Object>} - New array in due date order
+ */
+function sortAssignmentsByDate(assignments) {
+  return [...assignments].sort(compareByDueDate);
+}
+
+/**
+ * Merges lists that are each already sorted by due date into one sorted list,
+ * without re-sorting the combined array.
+ * @param {Array<Array<Object>>} lists - Assignment lists, each in due date order
+ * @returns {Array<Object>} - Combined list in due date order
+ */
+function mergeSortedAssignments(lists) {
+  return lists.reduce((merged, list) => {
+    const result = [];
+    let i = 0;
+    let j = 0;
+    while (i < merged.length && j < list.length) {
+      // <= keeps earlier lists first on ties
+      if (compareByDueDate(merged[i], list[j]) <= 0) {
+        result.push(merged[i++]);
+      } else {
+        result.push(list[j++]);
+      }
+    }
+    while (i < merged.length) result.push(merged[i++]);
+    while (j < list.length) result.push(list[j++]);
+    return result;
+  }, []);
+}
+
+// Distinguishes temp files from writes started in the same millisecond
+let tmpFileCounter = 0;
+
+/**
+ * Writes a file so readers never see a partial write: the data goes to a
+ * temp file in the same directory, is synced, then renamed over the target.
+ * @param {string} filename - Destination path
+ * @param {string} data - File contents
+ */
+async function writeFileAtomic(filename, data) {
+  // Unique per write: Jupiter and the Google workflows run concurrently, and two
+  // overlapping writes to one target must not share (and clobber) a temp file
+  const tmpFile = `${filename}.${process.pid}.${Date.now()}.${++tmpFileCounter}.tmp`;
+  try {
+    const handle = await fs.open(tmpFile, 'w');
+    try {
+      await handle.writeFile(data, 'utf8');
+      await handle.sync();
+    } finally {
+      await handle.close();
+    }
+    await fs.rename(tmpFile, filename);
+  } catch (error) {
+    // Don't leave a stale temp file behind
+    await fs.unlink(tmpFile).catch(() => {});
+    throw error;
+  }
+}
+
 async function saveAssignments(assignments, filename = ASSIGNMENTS_FILE) {
   try {
-    await fs.writeFile(filename, JSON.stringify(assignments, null, 2), 'utf8');
+    await writeFileAtomic(filename, JSON.stringify(assignments, null, 2));
     return true;
   } catch (error) {
     console.error(`Failed to save assignments to ${filename}:`, error);
@@ -204,11 +526,21 @@ async function loadAssignments(filename = ASSIGNMENTS_FILE) {
 }
 
 module.exports = {
+  checkScrapingCanceled,
+  mapWithConcurrency,
+  setResourceBlocking,
+  loadUrlEager,
+  waitForSelector,
+  waitForIdle,
   parseDueDate,
   createAssignmentObject,
   cleanCourseName,
+  compareByDueDate,
+  sortAssignmentsByDate,
+  mergeSortedAssignments,
   saveAssignments,
   loadAssignments,
+  writeFileAtomic,
   DATA_DIR,
   ASSIGNMENTS_FILE
 };
\ No newline at end of file
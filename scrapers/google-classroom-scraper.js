@@ -1,30 +1,85 @@
+const fs = require('fs').promises;
 const { logToRenderer } = require('core/logger');
-const { createAssignmentObject } = require('scrapers/assignment-utils');
+const { createAssignmentObject, sortAssignmentsByDate, checkScrapingCanceled, mapWithConcurrency, writeFileAtomic, loadUrlEager, waitForSelector, waitForIdle, setResourceBlocking } = require('scrapers/assignment-utils');
+const {
+  ASSIGNMENT_DETAILS_CACHE_FILE,
+  GOOGLE_CLASSROOM_URL_BASE,
+  GOOGLE_CLASSROOM_ASSIGNMENTS_PATH,
+  GOOGLE_CLASSROOM_MISSING_PATH,
+  GOOGLE_CLASSROOM_DONE_PATH
+} = require('config/constants');
 
 // Section headers used for organizing assignments on Google Classroom pages
 const SECTION_HEADERS = ['No due date', 'This week', 'Next week', 'Last week', 'Later', 'Earlier', 'Done early'];
 
-// Helper function to check if scraping has been canceled
-function checkScrapingCanceled() {
-  // Access the global cancellation flag from main process
-  if (global.isScrapingCanceled && global.isScrapingCanceled()) {
-    throw new Error('Scraping canceled by user');
+// How many assignment details pages to fetch at once
+const DETAIL_FETCH_CONCURRENCY = 8;
+
+// Longest to wait for the list to change after clicking expansion buttons
+const EXPANSION_SETTLE_TIMEOUT_MS = 3000;
+
+// In-page function that resolves true as soon as isSettled() holds after a DOM
+// change, or false after timeoutMs
+const WAIT_UNTIL_SETTLED_FUNCTION = `
+  function(isSettled, timeoutMs) {
+    return new Promise((resolve) => {
+      if (isSettled()) {
+        resolve(true);
+        return;
+      }
+      const observer = new MutationObserver(() => {
+        if (isSettled()) {
+          observer.disconnect();
+          clearTimeout(timer);
+          resolve(true);
+        }
+      });
+      observer.observe(document.documentElement, { childList: true, subtree: true, attributes: true, attributeFilter: ['aria-expanded'] });
+      const timer = setTimeout(() => {
+        observer.disconnect();
+        resolve(false);
+      }, timeoutMs);
+    });
   }
-}
+`;
+
+// Longest to wait for Classroom to swap in another tab's list after an in-page switch
+const TAB_SWITCH_TIMEOUT_MS = 5000;
+
+// Element that marks a details page's content as rendered
+const DETAILS_CONTENT_SELECTOR = 'div[guidedhelpid*="assignmentInstructions"], div[role="main"]';
+// Every assignment on a list tab is a link to its details page
+const ASSIGNMENT_LINK_SELECTOR = 'a[href*="details"]';
+
+// How long scraped details for an assignment URL are reused before re-scraping
+const DETAILS_CACHE_TTL_MS = 12 * 60 * 60 * 1000; // 12 hours
+// Expired entries with an ETag/Last-Modified are kept this long so they can be revalidated
+const DETAILS_CACHE_REVALIDATE_MS = 7 * 24 * 60 * 60 * 1000; // 7 days
+
+// Tab URLs per account number, built once per account
+const classroomUrlsByAccount = new Map();
 
 // Generate URLs for a specific Google account
 function getGoogleClassroomUrls(accountNumber = 0) {
-  return {
-    ASSIGNED_URL: `https://classroom.google.com/u/${accountNumber}/a/not-turned-in/all`,
-    MISSING_URL: `https://classroom.google.com/u/${accountNumber}/a/missing/all`,
-    DONE_URL: `https://classroom.google.com/u/${accountNumber}/a/turned-in/all`
-  };
+  if (!classroomUrlsByAccount.has(accountNumber)) {
+    const accountBase = `${GOOGLE_CLASSROOM_URL_BASE}${accountNumber}`;
+    classroomUrlsByAccount.set(accountNumber, Object.freeze({
+      ASSIGNED_URL: `${accountBase}${GOOGLE_CLASSROOM_ASSIGNMENTS_PATH}`,
+      MISSING_URL: `${accountBase}${GOOGLE_CLASSROOM_MISSING_PATH}`,
+      DONE_URL: `${accountBase}${GOOGLE_CLASSROOM_DONE_PATH}`
+    }));
+  }
+  return classroomUrlsByAccount.get(accountNumber);
 }
 
 async function scrapeGoogleClassroomAssignments(browserView, accountNumber = 0) {
   logToRenderer(`[GoogleC] Starting assignment scraping for account /u/${accountNumber}...`, 'info');
   
-  const allAssignments = [];
+  const listedAssignments = [];
+  const detailsCache = await loadDetailsCache();
+  
+  // Authentication is done by now, so skip images/fonts/media while scraping
+  setResourceBlocking(browserView.webContents, true);
   
   try {
     // Get URLs for the specified account
@@ -44,18 +99,35 @@ async function scrapeGoogleClassroomAssignments(browserView, accountNumber = 0)
       
       logToRenderer(`[GoogleC] Scraping ${tab.label} assignments for account /u/${accountNumber}...`, 'info');
       
-      // Step 1: Load the URL and wait for it to settle
-      logToRenderer(`[GoogleC] Loading ${tab.label} tab...`, 'info');
-      await browserView.webContents.loadURL(tab.url);
-      await waitBriefly(1000); // Wait for page to load and settle
+      // Step 1: Load the URL and wait for the list to render. The authentication
+      // check leaves us on the assigned tab already, so don't load that page twice.
+      // Later tabs are switched to in the page when possible rather than reloaded.
+      if (browserView.webContents.getURL() === tab.url) {
+        logToRenderer(`[GoogleC] Already on ${tab.label} tab, skipping reload`, 'info');
+      } else if (await switchToTabInPage(browserView, tab.url)) {
+        logToRenderer(`[GoogleC] Switched to ${tab.label} tab in the page`, 'info');
+      } else {
+        logToRenderer(`[GoogleC] Loading ${tab.label} tab...`, 'info');
+        // The list is waited for below, so only wait for the DOM here, not every subresource
+        await loadUrlEager(browserView.webContents, tab.url);
+      }
       
       // Check for cancellation after page load
       checkScrapingCanceled();
       
-      // Get the current URL after navigation
+      // Get the current URL after navigation. This is checked before waiting for
+      // the list, which would never appear on a sign-in page.
       const currentUrl = browserView.webContents.getURL();
       logToRenderer(`[GoogleC] Current URL after navigation: ${currentUrl}`, 'info');
       
+      // Signed out mid-scrape: every remaining tab would redirect here too, so stop
+      // and report it as an authentication problem instead of scraping nothing
+      if (currentUrl.includes('accounts.google.com')) {
+        const errorMsg = `Signed out of account /u/${accountNumber} during scraping (redirected to ${currentUrl})`;
+        logToRenderer(`[GoogleC] ${errorMsg}`, 'error');
+        return { success: false, error: errorMsg, needsAuth: true, assignments: [] };
+      }
+      
       // Verify we're still on Google Classroom (should be, but double-check)
       if (!currentUrl.includes('classroom.google.com')) {
         logToRenderer(`[GoogleC] Unexpected redirect during scraping: ${currentUrl}`, 'warn');
@@ -70,40 +142,44 @@ async function scrapeGoogleClassroomAssignments(browserView, accountNumber = 0)
         continue;
       }
       
+      const tabReady = await waitForTabContent(browserView.webContents);
+      if (!tabReady) {
+        logToRenderer(`[GoogleC] No assignment list appeared on ${tab.label} tab - continuing anyway`, 'warn');
+      }
+      
       // Step 3: Extract assignment counts for validation
       logToRenderer(`[GoogleC] Extracting assignment counts for validation on ${tab.label} tab...`, 'info');
       const countResult = await extractAssignmentCounts(browserView);
       
       // Step 4: Expand all content on this tab
       logToRenderer(`[GoogleC] Expanding content on ${tab.label} tab...`, 'info');
-      for (const sectionHeader of SECTION_HEADERS) {
-        if (countResult.countsBySection[sectionHeader] > 5) {
-          const expansionResult = await expandPageContent(browserView, sectionHeader);
-          if (expansionResult.expandedClicks > 0 || expansionResult.viewAllClicks > 0) {
-            logToRenderer(`[GoogleC] Expanded ${sectionHeader} section: ${expansionResult.expandedClicks} expansion buttons, ${expansionResult.viewAllClicks} View All buttons`, 'info');
-          }
+      const sectionsToExpand = SECTION_HEADERS.filter(sectionHeader => countResult.countsBySection[sectionHeader] > 5);
+      if (sectionsToExpand.length > 0) {
+        const expansionResult = await expandPageContent(browserView, sectionsToExpand);
+        if (expansionResult.expandedClicks > 0 || expansionResult.viewAllClicks > 0) {
+          logToRenderer(`[GoogleC] Expanded ${sectionsToExpand.join(', ')} sections: ${expansionResult.expandedClicks} expansion buttons, ${expansionResult.viewAllClicks} View All buttons`, 'info');
         }
       }
       
-      // Step 5: Wait a bit more for any final content to settle
+      // Step 5: Let any final rendering finish before reading the list
       logToRenderer(`[GoogleC] Waiting for final content settlement on ${tab.label} tab...`, 'info');
-      await waitBriefly(300);
+      await waitForIdle(browserView.webContents);
       
-      // Step 6: Count total assignment links on the page (before filtering)
-      logToRenderer(`[GoogleC] Counting total assignment links on ${tab.label} tab...`, 'info');
-      const linkCountResult = await browserView.webContents.executeJavaScript(`
-        (function() {
-          const allLinks = document.querySelectorAll('a[href*="details"]');
-          return { totalLinks: allLinks.length };
-        })()
-      `);
+      // Step 6: Extract assignments from the fully expanded page. This also counts
+      // every assignment link on the page (before filtering) for validation.
+      logToRenderer(`[GoogleC] Extracting assignments from ${tab.label} tab...`, 'info');
+      const { assignments: basicAssignments, totalLinks } = await extractAssignmentsFromExpandedPage(
+        browserView, 
+        tab.isMissing, 
+        tab.isDoneButMissing
+      );
       
       // Step 7: Validate assignment counts
       if (countResult.total > 0) {
-        logToRenderer(`[GoogleC] Validating assignment counts on ${tab.label} tab: Expected ${countResult.total}, Found ${linkCountResult.totalLinks} assignment links`, 'info');
+        logToRenderer(`[GoogleC] Validating assignment counts on ${tab.label} tab: Expected ${countResult.total}, Found ${totalLinks} assignment links`, 'info');
         
-        if (linkCountResult.totalLinks !== countResult.total) {
-          const errorMsg = `Assignment count mismatch on ${tab.label} tab: Expected ${countResult.total} assignments but found ${linkCountResult.totalLinks} assignment links. Page may not have loaded completely.`;
+        if (totalLinks !== countResult.total) {
+          const errorMsg = `Assignment count mismatch on ${tab.label} tab: Expected ${countResult.total} assignments but found ${totalLinks} assignment links. Page may not have loaded completely.`;
           logToRenderer(`[GoogleC] ${errorMsg}`, 'error');
           return { success: false, error: errorMsg, assignments: [] };
         } else {
@@ -113,50 +189,214 @@ async function scrapeGoogleClassroomAssignments(browserView, accountNumber = 0)
         logToRenderer(`[GoogleC] No assignment counts found for validation on ${tab.label} tab - skipping count validation`, 'warn');
       }
       
-      // Step 8: Extract assignments from the fully expanded page
-      logToRenderer(`[GoogleC] Extracting assignments from ${tab.label} tab...`, 'info');
-      const basicAssignments = await extractAssignmentsFromExpandedPage(
-        browserView, 
-        tab.isMissing, 
-        tab.isDoneButMissing
-      );
-      
-      // Extract detailed information for each assignment
-      logToRenderer(`[GoogleC] Extracting detailed info for ${basicAssignments.length} assignments from ${tab.label} tab...`, 'info');
-      const detailedAssignments = [];
-      
-      for (let i = 0; i < basicAssignments.length; i++) {
-        const assignment = basicAssignments[i];
-        logToRenderer(`[GoogleC] Getting details for assignment ${i + 1}/${basicAssignments.length}: ${assignment.name}`, 'info');
-        
-        const details = await extractAssignmentDetails(browserView, assignment.url);
-        
-        // Merge basic info with detailed info
-        const detailedAssignment = {
-          ...assignment,
-          description: details.description,
-          maxPoints: details.maxPoints,
-          detailedDueDate: details.dueDate || assignment.dueDate
-        };
-        
-        detailedAssignments.push(detailedAssignment);
-        
-        // Brief pause between requests to be respectful
-        await waitBriefly(1000);
-      }
-      
-      allAssignments.push(...detailedAssignments);
-      logToRenderer(`[GoogleC] Found ${detailedAssignments.length} assignments with details in ${tab.label} tab for account /u/${accountNumber}`, 'info');
+      listedAssignments.push(...basicAssignments);
+      logToRenderer(`[GoogleC] Found ${basicAssignments.length} assignments in ${tab.label} tab for account /u/${accountNumber}`, 'info');
     }
     
-    const uniqueAssignments = deduplicateAssignments(allAssignments);
+    // The same assignment can show up on more than one tab, so dedupe before
+    // looking up details and every details page is fetched at most once
+    const uniqueListedAssignments = deduplicateAssignments(listedAssignments);
+    const uniqueAssignments = await addAssignmentDetails(browserView, uniqueListedAssignments, detailsCache);
     logToRenderer(`[GoogleC] Total unique assignments found for account /u/${accountNumber}: ${uniqueAssignments.length}`, 'success');
+    
+    await saveDetailsCache(detailsCache);
 
     return { success: true, assignments: uniqueAssignments };
     
   } catch (error) {
     logToRenderer(`[GoogleC] Error scraping account /u/${accountNumber}: ${error.message}`, 'error');
     return { success: false, error: error.message, assignments: [] };
+  } finally {
+    setResourceBlocking(browserView.webContents, false);
+  }
+}
+
+/**
+ * Look up description, points and detailed due date for each listed assignment:
+ * from the details cache, then by fetching details pages directly (several at a
+ * time), and finally by visiting any remaining pages in the browser view.
+ * @param {BrowserView} browserView - View currently showing a Classroom page
+ * @param {Array<Object>} basicAssignments - Deduplicated assignments from the list tabs
+ * @param {Object} detailsCache - Details cache from loadDetailsCache, updated in place
+ * @returns {Promise<Array<Object>>} - The assignments with their details merged in
+ */
+async function addAssignmentDetails(browserView, basicAssignments, detailsCache) {
+  logToRenderer(`[GoogleC] Extracting detailed info for ${basicAssignments.length} assignments...`, 'info');
+  const detailedAssignments = [];
+  
+  // Reuse details scraped recently for the same assignment URL
+  const fetchedDetails = basicAssignments.map(assignment => getCachedDetails(detailsCache, assignment.url));
+  const uncachedIndexes = [];
+  fetchedDetails.forEach((details, index) => {
+    if (!details) uncachedIndexes.push(index);
+  });
+  if (uncachedIndexes.length < basicAssignments.length) {
+    logToRenderer(`[GoogleC] Using cached details for ${basicAssignments.length - uncachedIndexes.length}/${basicAssignments.length} assignments`, 'info');
+  }
+  
+  // Prefer plain HTTP fetches of the details pages, several at a time;
+  // anything that can't be fetched is visited in the browser below
+  if (uncachedIndexes.length > 0) {
+    logToRenderer(`[GoogleC] Fetching ${uncachedIndexes.length} details pages (up to ${DETAIL_FETCH_CONCURRENCY} at a time)...`, 'info');
+    const results = await mapWithConcurrency(uncachedIndexes, DETAIL_FETCH_CONCURRENCY, (index) => {
+      checkScrapingCanceled();
+      const url = basicAssignments[index].url;
+      return fetchAssignmentDetails(browserView, url, getCacheValidators(detailsCache, url));
+    });
+    
+    let fetchedCount = 0;
+    let notModifiedCount = 0;
+    results.forEach((result, i) => {
+      if (!result) return;
+      const index = uncachedIndexes[i];
+      const url = basicAssignments[index].url;
+      if (result.notModified) {
+        // The page hasn't changed since we cached it, so the old details still hold
+        const entry = detailsCache[url];
+        fetchedDetails[index] = { description: entry.description, maxPoints: entry.maxPoints, dueDate: entry.dueDate };
+        setCachedDetails(detailsCache, url, fetchedDetails[index], entry);
+        notModifiedCount++;
+      } else {
+        fetchedDetails[index] = result.details;
+        setCachedDetails(detailsCache, url, result.details, result.validators);
+      }
+      fetchedCount++;
+    });
+    logToRenderer(`[GoogleC] Fetched ${fetchedCount}/${uncachedIndexes.length} details pages directly (${notModifiedCount} unchanged)`, 'info');
+    if (fetchedCount === 0) {
+      logToRenderer(`[GoogleC] Could not fetch details pages directly - visiting detail pages in the browser instead`, 'warn');
+    }
+  }
+  
+  for (let i = 0; i < basicAssignments.length; i++) {
+    const assignment = basicAssignments[i];
+    
+    let details = fetchedDetails[i];
+    const usedNavigation = !details;
+    if (usedNavigation) {
+      checkScrapingCanceled();
+      logToRenderer(`[GoogleC] Getting details for assignment ${i + 1}/${basicAssignments.length}: ${assignment.name}`, 'info');
+      details = await extractAssignmentDetails(browserView, assignment.url);
+      // Only cache complete extractions so a failed visit is retried next run
+      if (details && !details.partial) {
+        setCachedDetails(detailsCache, assignment.url, details);
+      }
+      if (!details) {
+        details = { description: '', maxPoints: 0, dueDate: '' };
+      }
+    }
+    
+    // Merge basic info with detailed info
+    const detailedAssignment = {
+      ...assignment,
+      description: details.description,
+      maxPoints: details.maxPoints,
+      detailedDueDate: details.dueDate || assignment.dueDate
+    };
+    
+    detailedAssignments.push(detailedAssignment);
+    
+    // Brief pause between page loads to be respectful
+    if (usedNavigation) {
+      await waitBriefly(1000);
+    }
+  }
+  
+  return detailedAssignments;
+}
+
+// Load the assignment details cache (URL -> details + fetchedAt)
+async function loadDetailsCache() {
+  try {
+    return JSON.parse(await fs.readFile(ASSIGNMENT_DETAILS_CACHE_FILE, 'utf8'));
+  } catch (error) {
+    if (error.code !== 'ENOENT') {
+      logToRenderer(`[GoogleC] Ignoring unreadable details cache: ${error.message}`, 'warn');
+    }
+    return {};
+  }
+}
+
+// Save the details cache, dropping entries that have expired and can't be revalidated
+async function saveDetailsCache(cache) {
+  const now = Date.now();
+  const freshEntries = {};
+  for (const [url, entry] of Object.entries(cache)) {
+    const age = now - entry.fetchedAt;
+    const canRevalidate = Boolean(entry.etag || entry.lastModified);
+    if (age < DETAILS_CACHE_TTL_MS || (canRevalidate && age < DETAILS_CACHE_REVALIDATE_MS)) {
+      freshEntries[url] = entry;
+    }
+  }
+  
+  try {
+    await writeFileAtomic(ASSIGNMENT_DETAILS_CACHE_FILE, JSON.stringify(freshEntries));
+  } catch (error) {
+    logToRenderer(`[GoogleC] Failed to save details cache: ${error.message}`, 'warn');
+  }
+}
+
+// Returns cached { description, maxPoints, dueDate } for a URL, or null if missing/expired
+function getCachedDetails(cache, url) {
+  const entry = cache[url];
+  if (!entry || Date.now() - entry.fetchedAt >= DETAILS_CACHE_TTL_MS) {
+    return null;
+  }
+  return { description: entry.description, maxPoints: entry.maxPoints, dueDate: entry.dueDate };
+}
+
+// Returns { etag, lastModified } stored for a URL, or null if there is nothing to revalidate with
+function getCacheValidators(cache, url) {
+  const entry = cache[url];
+  if (!entry || !(entry.etag || entry.lastModified)) {
+    return null;
+  }
+  return { etag: entry.etag || '', lastModified: entry.lastModified || '' };
+}
+
+function setCachedDetails(cache, url, details, validators = {}) {
+  cache[url] = {
+    description: details.description,
+    maxPoints: details.maxPoints,
+    dueDate: details.dueDate,
+    etag: validators.etag || '',
+    lastModified: validators.lastModified || '',
+    fetchedAt: Date.now()
+  };
+}
+
+/**
+ * Switch to another assignment list tab by clicking the page's own link to it,
+ * so Classroom swaps the list in place instead of reloading the whole app.
+ * The current tab's links are marked first, and the switch only counts once
+ * the URL matches and all of them are gone.
+ * @param {BrowserView} browserView - View currently showing a Classroom list tab
+ * @param {string} tabUrl - URL of the tab to switch to
+ * @returns {Promise<boolean>} - False if there was no link to click, nothing to
+ *   tell the lists apart by, or the list didn't change in time; load the URL instead
+ */
+async function switchToTabInPage(browserView, tabUrl) {
+  const targetPath = new URL(tabUrl).pathname;
+  try {
+    return await browserView.webContents.executeJavaScript(`
+      (async function() {
+        const targetPath = ${JSON.stringify(targetPath)};
+        const tabLink = Array.from(document.querySelectorAll('a[href]'))
+          .find(a => new URL(a.href, location.href).pathname === targetPath);
+        const currentLinks = document.querySelectorAll(${JSON.stringify(ASSIGNMENT_LINK_SELECTOR)});
+        if (!tabLink || currentLinks.length === 0) return false;
+        
+        currentLinks.forEach(link => link.setAttribute('data-hw-previous-tab', ''));
+        tabLink.click();
+        return (${WAIT_UNTIL_SETTLED_FUNCTION})(
+          () => location.pathname === targetPath && !document.querySelector('[data-hw-previous-tab]'),
+          ${TAB_SWITCH_TIMEOUT_MS}
+        );
+      })()
+    `);
+  } catch (error) {
+    logToRenderer(`[GoogleC] In-page tab switch failed: ${error.message}`, 'warn');
+    return false;
   }
 }
 
@@ -166,61 +406,105 @@ async function waitBriefly(milliseconds) {
   });
 }
 
-// Extract assignment counts from page headers for validation
-async function extractAssignmentCounts(browserView) {
-  logToRenderer(`[GoogleC] Extracting assignment counts from page headers...`, 'info');
-  
-  const sectionHeadersJson = JSON.stringify(SECTION_HEADERS);
-  
-  const result = await browserView.webContents.executeJavaScript(`
-    (function() {
-      const sectionHeaders = ${sectionHeadersJson};
-      const countsBySection = {};
-      
-      // Initialize all sections to 0
-      for (const header of sectionHeaders) {
-        countsBySection[header] = 0;
+/**
+ * Wait for an assignment list tab to render: an assignment link, or one of the
+ * list's own section headers (an h2 naming a SECTION_HEADERS entry). Any h2 is
+ * not enough, since the page shell's headings render before the list does.
+ * @param {WebContents} webContents - The webContents showing the tab
+ * @param {number} timeoutMs - Longest to wait
+ * @returns {Promise<boolean>} - True if the list rendered before the timeout
+ */
+function waitForTabContent(webContents, timeoutMs = 10000) {
+  return webContents.executeJavaScript(`
+    new Promise((resolve) => {
+      const sectionHeaders = ${JSON.stringify(SECTION_HEADERS)};
+      const isRendered = () => {
+        if (document.querySelector(${JSON.stringify(ASSIGNMENT_LINK_SELECTOR)})) return true;
+        for (const h2 of document.querySelectorAll('h2')) {
+          const text = h2.textContent;
+          if (sectionHeaders.some(header => text.includes(header))) return true;
+        }
+        return false;
+      };
+      if (isRendered()) {
+        resolve(true);
+        return;
       }
       
-      // Look for h2 elements that contain section headers
-      const h2Elements = document.querySelectorAll('h2');
+      const observer = new MutationObserver(() => {
+        if (isRendered()) {
+          observer.disconnect();
+          clearTimeout(timer);
+          resolve(true);
+        }
+      });
+      observer.observe(document.documentElement, { childList: true, subtree: true, characterData: true });
       
-      for (const h2 of h2Elements) {
-        const text = h2.textContent.trim();
-        
-        // Check if this h2 contains one of the expected section headers
-        let isSectionHeader = false;
-        let sectionName = '';
-        
-        for (const header of sectionHeaders) {
-          if (text.includes(header)) {
-            isSectionHeader = true;
-            sectionName = header;
-            break;
-          }
+      const timer = setTimeout(() => {
+        observer.disconnect();
+        resolve(false);
+      }, ${timeoutMs});
+    })
+  `);
+}
+
+// Page script that reads the per-section counts from the h2 headers. It only
+// depends on SECTION_HEADERS, so it is built once.
+const ASSIGNMENT_COUNTS_SCRIPT = `
+  (function() {
+    const sectionHeaders = ${JSON.stringify(SECTION_HEADERS)};
+    const countsBySection = {};
+    
+    // Initialize all sections to 0
+    for (const header of sectionHeaders) {
+      countsBySection[header] = 0;
+    }
+    
+    // Look for h2 elements that contain section headers
+    const h2Elements = document.querySelectorAll('h2');
+    
+    for (const h2 of h2Elements) {
+      const text = h2.textContent.trim();
+      
+      // Check if this h2 contains one of the expected section headers
+      let isSectionHeader = false;
+      let sectionName = '';
+      
+      for (const header of sectionHeaders) {
+        if (text.includes(header)) {
+          isSectionHeader = true;
+          sectionName = header;
+          break;
         }
-        
-        if (isSectionHeader) {
-          // Get the text content of the div containing the h2
-          const containerDiv = h2.closest('div');
-          if (containerDiv) {
-            const containerText = containerDiv.textContent.trim();
-            // Extract the number from the container text (should be after the section name)
-            const numberMatch = containerText.match(/(\\d+)/);
-            if (numberMatch) {
-              const count = parseInt(numberMatch[1], 10);
-              countsBySection[sectionName] = count;
-            }
+      }
+      
+      if (isSectionHeader) {
+        // Get the text content of the div containing the h2
+        const containerDiv = h2.closest('div');
+        if (containerDiv) {
+          const containerText = containerDiv.textContent.trim();
+          // Extract the number from the container text (should be after the section name)
+          const numberMatch = containerText.match(/(\\d+)/);
+          if (numberMatch) {
+            const count = parseInt(numberMatch[1], 10);
+            countsBySection[sectionName] = count;
           }
         }
       }
-      
-      // Calculate total count
-      const total = Object.values(countsBySection).reduce((sum, count) => sum + count, 0);
-      
-      return { countsBySection, total };
-    })()
-  `);
+    }
+    
+    // Calculate total count
+    const total = Object.values(countsBySection).reduce((sum, count) => sum + count, 0);
+    
+    return { countsBySection, total };
+  })()
+`;
+
+// Extract assignment counts from page headers for validation
+async function extractAssignmentCounts(browserView) {
+  logToRenderer(`[GoogleC] Extracting assignment counts from page headers...`, 'info');
+  
+  const result = await browserView.webContents.executeJavaScript(ASSIGNMENT_COUNTS_SCRIPT);
   
   if (result.total > 0) {
     const countsList = Object.entries(result.countsBySection)
@@ -235,17 +519,34 @@ async function extractAssignmentCounts(browserView) {
   return result;
 }
 
-async function expandPageContent(browserView, sectionHeader) {
-  // Handle expansion buttons for the specified section header
-  const sectionHeaderJson = JSON.stringify(sectionHeader);
+/**
+ * Expand the given sections of the current list tab, then click every "View all"
+ * button, all in one page script.
+ * @param {BrowserView} browserView - View showing a Classroom list tab
+ * @param {Array<string>} sectionHeaders - Sections whose expansion buttons to click
+ * @returns {Promise<Object>} - { expandedClicks, viewAllClicks }
+ */
+async function expandPageContent(browserView, sectionHeaders) {
+  const sectionHeadersJson = JSON.stringify(sectionHeaders);
+  const sectionLabel = sectionHeaders.join(', ');
   
-  const expandedResult = await browserView.webContents.executeJavaScript(`
-    (function() {
-      const sectionHeader = ${sectionHeaderJson};
-      const expansionButtons = document.querySelectorAll('button[aria-label*="' + sectionHeader + '"]');
-      let clickCount = 0;
-      const clickedButtons = [];
+  const result = await browserView.webContents.executeJavaScript(`
+    (async function() {
+      const sectionHeaders = ${sectionHeadersJson};
+      const countLinks = () => document.querySelectorAll(${JSON.stringify(ASSIGNMENT_LINK_SELECTOR)}).length;
+      const waitUntilSettled = ${WAIT_UNTIL_SETTLED_FUNCTION};
+      
+      // Expansion buttons for these sections
+      let linkCountBefore = countLinks();
+      const clickedElements = [];
+      const expansionButtons = document.querySelectorAll(
+        sectionHeaders.map(header => 'button[aria-label*=' + JSON.stringify(header) + ']').join(', ')
+      );
+      let expandedClicks = 0;
+      const expandedButtons = [];
       const skippedButtons = [];
+      // Clicks that threw (e.g. the button was detached mid-loop), reported back
+      const clickErrors = [];
       
       for (const button of expansionButtons) {
         if (button.offsetParent !== null) { // Check if button is visible
@@ -256,100 +557,99 @@ async function expandPageContent(browserView, sectionHeader) {
             // Only click if it's not already expanded
             if (ariaExpanded !== 'true') {
               button.click();
-              clickedButtons.push(ariaLabel);
-              clickCount++;
+              clickedElements.push(button);
+              expandedButtons.push(ariaLabel);
+              expandedClicks++;
             } else {
               skippedButtons.push(ariaLabel + ' (already expanded)');
             }
           } catch (e) {
-            // Can't log errors here, will return them
+            clickErrors.push(e.message);
           }
         }
       }
       
-      return { clickCount, clickedButtons, skippedButtons };
-    })()
-  `);
-  
-  if (expandedResult.clickCount > 0) {
-    logToRenderer(`[GoogleC] Clicked ${expandedResult.clickCount} ${sectionHeader} expansion buttons: ${expandedResult.clickedButtons.join(', ')}`, 'info');
-    await waitBriefly(200);
-  }
-  
-  if (expandedResult.skippedButtons.length > 0) {
-    logToRenderer(`[GoogleC] Skipped ${expandedResult.skippedButtons.length} ${sectionHeader} expansion buttons: ${expandedResult.skippedButtons.join(', ')}`, 'info');
-  }
-  
-  // Handle "View all" buttons within this section - these expand condensed sections
-  const viewAllResult = await browserView.webContents.executeJavaScript(`
-    (function() {
-      const sectionHeader = ${sectionHeaderJson};
-      let clickCount = 0;
-      const clickedButtons = [];
-      
-      // Method 1: Look for spans containing "view all" text
-      const viewAllSpans = document.querySelectorAll('span');
-      for (const span of viewAllSpans) {
-        const text = span.textContent ? span.textContent.toLowerCase() : '';
-        if (text.includes('view all')) {
-          try {
-            const button = span.closest('button');
-            if (button && button.offsetParent !== null) {
-              button.click();
-              clickedButtons.push('Method 1: ' + span.textContent.trim());
-              clickCount++;
-            }
-          } catch (e) {
-            // Can't log errors here
-          }
-        }
+      // Wait until more assignments are listed or the buttons report being expanded
+      if (expandedClicks > 0) {
+        await waitUntilSettled(
+          () => countLinks() > linkCountBefore ||
+            clickedElements.every(button => button.getAttribute('aria-expanded') === 'true'),
+          ${EXPANSION_SETTLE_TIMEOUT_MS}
+        );
       }
       
-      // Method 2: Look for buttons directly containing "view all" text
-      const viewAllButtons = document.querySelectorAll('button');
-      for (const button of viewAllButtons) {
+      // "View all" buttons - these expand condensed sections. A button matches
+      // if a span inside it, its own text, or its aria-label says "view all";
+      // one pass over the buttons clicks each match once.
+      linkCountBefore = countLinks();
+      let viewAllClicks = 0;
+      const viewAllButtons = [];
+      
+      for (const button of document.querySelectorAll('button')) {
+        if (button.offsetParent === null) continue;
         const text = button.textContent ? button.textContent.toLowerCase() : '';
-        if (text.includes('view all') && button.offsetParent !== null) {
-          try {
-            button.click();
-            clickedButtons.push('Method 2: ' + button.textContent.trim());
-            clickCount++;
-          } catch (e) {
-            // Can't log errors here
-          }
+        const ariaLabel = (button.getAttribute('aria-label') || '').toLowerCase();
+        if (!text.includes('view all') && !ariaLabel.includes('view all')) continue;
+        try {
+          button.click();
+          viewAllButtons.push(button.textContent.trim() || button.getAttribute('aria-label'));
+          viewAllClicks++;
+        } catch (e) {
+          clickErrors.push(e.message);
         }
       }
       
-      // Method 3: Look for aria-label containing "view all"
-      const ariaButtons = document.querySelectorAll('button[aria-label*="view"], button[aria-label*="View"]');
-      for (const button of ariaButtons) {
-        const ariaLabel = button.getAttribute('aria-label').toLowerCase();
-        if (ariaLabel.includes('view all') && button.offsetParent !== null) {
-          try {
-            button.click();
-            clickedButtons.push('Method 3: ' + button.getAttribute('aria-label'));
-            clickCount++;
-          } catch (e) {
-            // Can't log errors here
-          }
-        }
-      }
+      // Wait for the newly revealed assignments to be added to the list
+      const viewAllSettled = viewAllClicks > 0
+        ? await waitUntilSettled(() => countLinks() > linkCountBefore, ${EXPANSION_SETTLE_TIMEOUT_MS})
+        : true;
       
-      return { clickCount, clickedButtons };
+      return { expandedClicks, expandedButtons, skippedButtons, viewAllClicks, viewAllButtons, viewAllSettled, clickErrors };
     })()
   `);
   
-  if (viewAllResult.clickCount > 0) {
-    logToRenderer(`[GoogleC] Clicked ${viewAllResult.clickCount} View All buttons: ${viewAllResult.clickedButtons.join(', ')}`, 'info');
-    await waitBriefly(1000);
+  if (result.expandedClicks > 0) {
+    logToRenderer(`[GoogleC] Clicked ${result.expandedClicks} ${sectionLabel} expansion buttons: ${result.expandedButtons.join(', ')}`, 'info');
+  }
+  
+  if (result.skippedButtons.length > 0) {
+    logToRenderer(`[GoogleC] Skipped ${result.skippedButtons.length} ${sectionLabel} expansion buttons: ${result.skippedButtons.join(', ')}`, 'info');
+  }
+  
+  if (result.clickErrors.length > 0) {
+    logToRenderer(`[GoogleC] ${result.clickErrors.length} button clicks failed in ${sectionLabel} sections: ${result.clickErrors[0]}`, 'warn');
+  }
+  
+  if (result.viewAllClicks > 0) {
+    logToRenderer(`[GoogleC] Clicked ${result.viewAllClicks} View All buttons: ${result.viewAllButtons.join(', ')}`, 'info');
+    if (!result.viewAllSettled) {
+      logToRenderer(`[GoogleC] No new assignments appeared after View All in ${sectionLabel} sections`, 'warn');
+    }
   }
   
   return { 
-    expandedClicks: expandedResult.clickCount, 
-    viewAllClicks: viewAllResult.clickCount 
+    expandedClicks: result.expandedClicks, 
+    viewAllClicks: result.viewAllClicks 
   };
 }
 
+// In-page function (as source) returning a node's text with a space at every
+// node boundary, read from the parsed DOM rather than by regex-stripping its
+// innerHTML. Bare textContent would glue "Lab 3" and "0/10" into "30/10".
+const NODE_TEXT_FUNCTION = `
+  function(node) {
+    if (!node) return '';
+    const parts = [];
+    const walker = (node.ownerDocument || node).createTreeWalker(node, NodeFilter.SHOW_TEXT);
+    while (walker.nextNode()) {
+      parts.push(walker.currentNode.nodeValue);
+    }
+    return parts.join(' ').replace(/\\s+/g, ' ').trim();
+  }
+`;
+
+// Returns { assignments, totalLinks }, where totalLinks counts every assignment
+// link on the page, including the ones filtered out
 async function extractAssignmentsFromExpandedPage(browserView, isMissing = false, isDoneButMissing = false) {
   // Page content should already be expanded by this point
   logToRenderer(`[GoogleC] Extracting assignments from expanded page...`, 'info');
@@ -357,7 +657,8 @@ async function extractAssignmentsFromExpandedPage(browserView, isMissing = false
   const result = await browserView.webContents.executeJavaScript(`
     (function() {
       const assignments = [];
-      const allLinks = document.querySelectorAll('a[href*="details"]');
+      const textOf = ${NODE_TEXT_FUNCTION};
+      const allLinks = document.querySelectorAll(${JSON.stringify(ASSIGNMENT_LINK_SELECTOR)});
       let processedLinks = 0;
       let skippedLinks = 0;
       
@@ -384,11 +685,7 @@ async function extractAssignmentsFromExpandedPage(browserView, isMissing = false
             if (${isDoneButMissing}) {
               const container = link.closest('li');
               if (container) {
-                const containerText = container.innerHTML
-                  .replace(/<[^>]*>/g, ' ')
-                  .replace(/\\s+/g, ' ')
-                  .trim()
-                  .toLowerCase();
+                const containerText = textOf(container).toLowerCase();
                 
                 const hasNotTurnedIn = containerText.includes('not turned in');
                 const hasMissing = containerText.includes('missing');
@@ -449,22 +746,158 @@ async function extractAssignmentsFromExpandedPage(browserView, isMissing = false
   
   logToRenderer(`[GoogleC] Processed ${result.processedLinks}/${result.totalLinks} links, skipped ${result.skippedLinks}, found ${result.assignments.length} valid assignments`, 'info');
   
-  return result.assignments;
+  return { assignments: result.assignments, totalLinks: result.totalLinks };
+}
+
+// In-page function (as source) that pulls description, points and the raw due
+// date text out of an assignment details document in a single pass over its
+// text. Works on the live page or a DOMParser document.
+const EXTRACT_DETAILS_FUNCTION = `
+  function(doc) {
+    const textOf = ${NODE_TEXT_FUNCTION};
+    let description = '';
+    let maxPoints = 0;
+    let dueDatePart = '';
+    let dueTimePart = '';
+    
+    // Extract description from div with guided_help_id containing "assignmentInstructions"
+    const descriptionSpan = doc.querySelector('div[guidedhelpid*="assignmentInstructions"] span');
+    if (descriptionSpan) {
+      description = descriptionSpan.textContent.trim();
+    }
+    
+    // Get the text of the FIRST div with role="main" (exact Python approach) once,
+    // falling back to the body, and run both the points and due date patterns on it
+    const mainDiv = doc.querySelector('div[role="main"]');
+    const mainText = textOf(mainDiv || doc.body);
+    
+    // Extract max points from text containing "[number] points". Only walk
+    // the whole document when the main content doesn't have it.
+    const pointsMatch = mainText.match(/(\\d+)\\s+[Pp]oints/) ||
+      textOf(doc.documentElement).match(/(\\d+)\\s+[Pp]oints/);
+    if (pointsMatch) {
+      maxPoints = parseInt(pointsMatch[1]);
+    }
+    
+    if (mainText) {
+      // Try to find the main "Due" statement, not just any "Due" text
+      // Look for "Due" followed by a date/time pattern more specifically
+      let dueMatch = mainText.match(/Due\\s+([A-Za-z]+(?:\\s+\\d{1,2})?(?:,\\s*\\d{1,2}:\\d{2}\\s*[AP]M)?)/i);
+      
+      // If that doesn't work, try the broader pattern but be more careful
+      if (!dueMatch) {
+        dueMatch = mainText.match(/Due\\s*([^,\\n]+?)(?:,\\s*([^,\\n]+?))?(?:\\s|$)/i);
+      }
+      if (dueMatch) {
+        dueDatePart = dueMatch[1].trim();
+        dueTimePart = dueMatch[2] ? dueMatch[2].trim() : '';
+      }
+    }
+    
+    return { description, maxPoints, dueDatePart, dueTimePart, foundMainDiv: !!mainDiv };
+  }
+`;
+
+const TIME_ONLY_DUE_PATTERN = /^\d{1,2}:\d{2}\s*(AM|PM)$/i;
+
+/**
+ * Turns the raw fields returned by EXTRACT_DETAILS_FUNCTION into
+ * { description, maxPoints, dueDate }.
+ * @param {Object} details - Raw in-page extraction result
+ * @returns {Object} - Normalized details
+ */
+function normalizeExtractedDetails(details) {
+  const datePart = details.dueDatePart || '';
+  const timePart = details.dueTimePart || '';
+  let dueDate = '';
+  
+  // A time on its own means it's due today
+  if (TIME_ONLY_DUE_PATTERN.test(datePart)) {
+    const today = new Date().toLocaleDateString('en-US', { 
+      month: 'long', 
+      day: 'numeric' 
+    });
+    dueDate = today + ', ' + datePart;
+  } else if (datePart) {
+    // Normal date format
+    dueDate = datePart + (timePart ? ', ' + timePart : '');
+  }
+  
+  return { 
+    description: details.description || '', 
+    maxPoints: details.maxPoints || 0, 
+    dueDate 
+  };
+}
+
+/**
+ * Fetch an assignment's details page over HTTP from inside the current Classroom
+ * page (same origin, so the session cookies go along) and parse it there, instead
+ * of navigating the browser view to it.
+ * When validators from an earlier fetch are given, the request is conditional and
+ * an unchanged page comes back as a body-less 304.
+ * @param {BrowserView} browserView - View currently showing a Classroom page
+ * @param {string} assignmentUrl - Details page URL
+ * @param {Object|null} validators - { etag, lastModified } from the cache, if any
+ * @returns {Promise<Object|null>} - { notModified: true } for a 304,
+ *   { details: { description, maxPoints, dueDate }, validators: { etag, lastModified } }
+ *   for a fresh page, or null if the fetched HTML wasn't usable and the caller
+ *   should navigate instead
+ */
+async function fetchAssignmentDetails(browserView, assignmentUrl, validators = null) {
+  const headers = {};
+  if (validators && validators.etag) headers['If-None-Match'] = validators.etag;
+  if (validators && validators.lastModified) headers['If-Modified-Since'] = validators.lastModified;
+  
+  try {
+    const result = await browserView.webContents.executeJavaScript(`
+      (async function() {
+        try {
+          const response = await fetch(${JSON.stringify(assignmentUrl)}, {
+            credentials: 'include',
+            headers: ${JSON.stringify(headers)}
+          });
+          if (response.status === 304) return { notModified: true };
+          if (!response.ok) return null;
+          const html = await response.text();
+          const doc = new DOMParser().parseFromString(html, 'text/html');
+          const details = (${EXTRACT_DETAILS_FUNCTION})(doc);
+          // Without the main content area this is probably a sign-in or error page
+          if (!details.foundMainDiv) return null;
+          return {
+            details,
+            etag: response.headers.get('ETag') || '',
+            lastModified: response.headers.get('Last-Modified') || ''
+          };
+        } catch (e) {
+          // Network error or a cross-origin redirect (e.g. to the sign-in page)
+          return null;
+        }
+      })()
+    `);
+    
+    if (!result) return null;
+    if (result.notModified) return { notModified: true };
+    
+    return {
+      details: normalizeExtractedDetails(result.details),
+      validators: { etag: result.etag, lastModified: result.lastModified }
+    };
+  } catch (error) {
+    logToRenderer(`[GoogleC] Error fetching assignment details from ${assignmentUrl}: ${error.message}`, 'warning');
+    return null;
+  }
 }
 
 async function extractAssignmentDetails(browserView, assignmentUrl) {
   /**
    * Extract detailed information from an assignment's details page
-   * Returns: { description, maxPoints, dueDate }
+   * Returns: { description, maxPoints, dueDate }, with partial: true when the
+   * content never appeared, or null when the page couldn't be read
    */
-  let description = '';
-  let maxPoints = 0;
-  let dueDate = '';
-  
   try {
-    logToRenderer(`[GoogleC] Visiting details page: ${assignmentUrl}`, 'info');
-    await browserView.webContents.loadURL(assignmentUrl);
-    await waitBriefly(1000); // Wait for page to load
+    // Only text is read from the page, so don't wait for images/fonts - just the content
+    await loadUrlEager(browserView.webContents, assignmentUrl);
     
     // Check if we're actually on a Google Classroom URL before attempting to extract
     const currentUrl = browserView.webContents.getURL();
@@ -472,162 +905,64 @@ async function extractAssignmentDetails(browserView, assignmentUrl) {
     
     if (!isGoogleClassroomUrl) {
       logToRenderer(`[GoogleC] Redirected away from Google Classroom when visiting details page: ${currentUrl}`, 'warn');
-      return { description: '', maxPoints: 0, dueDate: '' };
+      return null;
+    }
+    
+    const contentReady = await waitForSelector(browserView.webContents, DETAILS_CONTENT_SELECTOR);
+    if (!contentReady) {
+      logToRenderer(`[GoogleC] Details content did not appear for ${assignmentUrl} - extracting what is there`, 'warn');
     }
     
     // Extract all the details in one JavaScript execution
-    const details = await browserView.webContents.executeJavaScript(`
-      (function() {
-        let description = '';
-        let maxPoints = 0;
-        let dueDate = '';
-        
-        // Extract description from div with guided_help_id containing "assignmentInstructions"
-        try {
-          const descriptionDiv = document.querySelector('div[guidedhelpid*="assignmentInstructions"]');
-          if (descriptionDiv) {
-            const descriptionSpan = descriptionDiv.querySelector('span');
-            if (descriptionSpan) {
-              description = descriptionSpan.textContent.trim();
-            }
-          }
-        } catch (e) {
-          // Description extraction failed
-        }
-        
-        // Extract max points from text containing "[number] points"
-        try {
-          const pointsElements = document.querySelectorAll('*');
-          for (const element of pointsElements) {
-            // Use innerHTML and strip HTML tags with spaces, same as main text processing
-            const html = element.innerHTML || '';
-            const text = html.replace(/<[^>]*>/g, ' ').replace(/\\s+/g, ' ').trim();
-            if (text && (text.includes('points') || text.includes('Points'))) {
-              const pointsMatch = text.match(/(\\d+)\\s+[Pp]oints/);
-              if (pointsMatch) {
-                maxPoints = parseInt(pointsMatch[1]);
-                break;
-              }
-            }
-          }
-        } catch (e) {
-          // Points extraction failed
-        }
-        
-        // Extract due date from main content area - following Python approach exactly
-        try {
-          let mainText = '';
-          let foundMainDiv = false;
-          
-          // Step 1: Get the FIRST div with role="main" (exact Python approach)
-          const mainDiv = document.querySelector('div[role="main"]');
-          if (mainDiv) {
-            // Use innerHTML and strip HTML tags with spaces, like Python version
-            const html = mainDiv.innerHTML || '';
-            mainText = html.replace(/<[^>]*>/g, ' ').replace(/\\s+/g, ' ').trim();
-            foundMainDiv = true;
-          } else {
-            // Fallback to body text if no main div found, also strip HTML
-            const html = document.body.innerHTML || '';
-            mainText = html.replace(/<[^>]*>/g, ' ').replace(/\\s+/g, ' ').trim();
-          }
-          
-          // Step 2: Apply the exact regex pattern from Python but be more selective
-          if (mainText) {
-            // Try to find the main "Due" statement, not just any "Due" text
-            // Look for "Due" followed by a date/time pattern more specifically
-            let dueMatch = mainText.match(/Due\\s+([A-Za-z]+(?:\\s+\\d{1,2})?(?:,\\s*\\d{1,2}:\\d{2}\\s*[AP]M)?)/i);
-            
-            // If that doesn't work, try the broader pattern but be more careful
-            if (!dueMatch) {
-              dueMatch = mainText.match(/Due\\s*([^,\\n]+?)(?:,\\s*([^,\\n]+?))?(?:\\s|$)/i);
-            }
-            if (dueMatch) {
-              let datePart = dueMatch[1].trim();
-              let timePart = dueMatch[2] ? dueMatch[2].trim() : '';
-              
-              // Step 3: Check for time-only pattern (implies today)
-              const timeOnlyPattern = /^\\d{1,2}:\\d{2}\\s*(AM|PM)$/i;
-              if (timeOnlyPattern.test(datePart)) {
-                // It's just a time, so it means today
-                const today = new Date().toLocaleDateString('en-US', { 
-                  month: 'long', 
-                  day: 'numeric' 
-                });
-                dueDate = today + ', ' + datePart;
-              } else {
-                // Normal date format
-                dueDate = datePart + (timePart ? ', ' + timePart : '');
-              }
-              
-              return { 
-                description, 
-                maxPoints, 
-                dueDate
-              };
-            } else {
-              // No due date match found
-              return { 
-                description, 
-                maxPoints, 
-                dueDate: ''
-              };
-            }
-          } else {
-            // No main text available
-            return { 
-              description, 
-              maxPoints, 
-              dueDate: ''
-            };
-          }
-        } catch (e) {
-          // Due date extraction failed
-          return { 
-            description, 
-            maxPoints, 
-            dueDate: ''
-          };
-        }
-        
-        // If we get here, return basic info without debug
-        return { description, maxPoints, dueDate };
-      })()
-    `);
+    const details = await browserView.webContents.executeJavaScript(`(${EXTRACT_DETAILS_FUNCTION})(document)`);
+    const normalized = normalizeExtractedDetails(details);
     
-    return { 
-      description: details.description || '', 
-      maxPoints: details.maxPoints || 0, 
-      dueDate: details.dueDate || '' 
-    };
+    return contentReady ? normalized : { ...normalized, partial: true };
     
   } catch (error) {
     logToRenderer(`[GoogleC] Error extracting assignment details from ${assignmentUrl}: ${error.message}`, 'warning');
-    return { description: '', maxPoints: 0, dueDate: '' };
+    return null;
   }
 }
 
+// Keep the first listing of each assignment, marking it missing if any tab did.
+// Assignments are matched by URL; one without a URL is matched by name and class
+// instead, in a separate map so an empty URL never collides with anything.
 function deduplicateAssignments(assignments) {
-  const seen = new Set();
-  return assignments.filter(assignment => {
-    const key = `${assignment.name}|${assignment.className}|${assignment.url}`;
-    if (seen.has(key)) return false;
-    seen.add(key);
-    return true;
-  });
+  const byUrl = new Map();
+  const byNameAndClass = new Map();
+  const unique = [];
+  
+  for (const assignment of assignments) {
+    const seen = assignment.url ? byUrl : byNameAndClass;
+    const key = assignment.url || `${assignment.name}\u0000${assignment.className}`;
+    const existing = seen.get(key);
+    if (existing) {
+      existing.isMissing = existing.isMissing || assignment.isMissing;
+    } else {
+      const copy = { ...assignment };
+      seen.set(key, copy);
+      unique.push(copy);
+    }
+  }
+  return unique;
 }
 
 async function convertToStandardFormat(rawAssignments) {
-  return rawAssignments.map(raw => 
+  // One reference time for the whole batch
+  const now = new Date();
+  // Returned in due date order so results can be merged without re-sorting
+  return sortAssignmentsByDate(rawAssignments.map(raw => 
     createAssignmentObject(
       raw.name,
       raw.className,
       raw.detailedDueDate || raw.dueDate,
       raw.url,
       raw.description || '', // Now we have description from detail pages
-      raw.maxPoints || 0     // Now we have points info from detail pages
+      raw.maxPoints || 0,    // Now we have points info from detail pages
+      now
     )
-  );
+  ));
 }
 
 module.exports = {
@@ -1,23 +1,22 @@
 const { logToRenderer } = require('core/logger');
 const { TEMP_DIR } = require('config/constants');
-const { createAssignmentObject } = require('scrapers/assignment-utils');
+const { createAssignmentObject, sortAssignmentsByDate, checkScrapingCanceled } = require('scrapers/assignment-utils');
 const fs = require('fs');
 const path = require('path');
 
-// Helper function to check if scraping has been canceled
-function checkScrapingCanceled() {
-  // Access the global cancellation flag from main process
-  if (global.isScrapingCanceled && global.isScrapingCanceled()) {
-    throw new Error('Scraping canceled by user');
-  }
-}
-
 /**
  * A helper function to introduce a delay.
  * @param {number} ms - Milliseconds to wait.
  */
 const delay = (ms) => new Promise(resolve => setTimeout(resolve, ms));
 
+// Patterns applied to every homework cell / TSV row
+const DUE_DATE_PATTERN = /due\s+([A-Za-z]+\s+\d{1,2}|\d{1,2}\/\d{1,2})/i;
+// Matches week date strings like "October 21, 2025"
+const WEEK_DATE_PATTERN = /^([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})$/;
+const SECTION_ONLY_PATTERN = /^\d+-\d+$|^\d+\.\d+$/;
+const HOMEWORK_PATTERN = /HW.*/i;
+
 /**
  * Sends a keyboard event (and its corresponding keyup).
  * @param {BrowserView} browserView
@@ -138,7 +137,7 @@ function captureCsvDownload(browserView) {
  */
 function extractDueDate(text) {
   // Look for "due" followed by a date in format "Month Day" or "MM/DD"
-  const dueMatch = text.match(/due\s+([A-Za-z]+\s+\d{1,2}|\d{1,2}\/\d{1,2})/i);
+  const dueMatch = text.match(DUE_DATE_PATTERN);
   if (!dueMatch) return null;
   
   const dateStr = dueMatch[1];
@@ -185,9 +184,6 @@ function parseTsvForAssignments(tsvData) {
   futureCutoffDate.setDate(today.getDate() + 21); // 3 weeks = 21 days
   logToRenderer(`Future cutoff date: ${futureCutoffDate.toLocaleDateString()} (3 weeks ahead)`, 'info');
   
-  // Regular expression to match date strings like "October 21, 2025"
-  const datePattern = /^([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})$/;
-  
   // Track pending homework assignment waiting for a due date (persists across weeks)
   let pendingHw = null;
   let weekCount = 0;
@@ -199,7 +195,7 @@ function parseTsvForAssignments(tsvData) {
     if (cells.length < 2) continue; // Need at least date + one day column
     
     const firstCell = cells[0].trim();
-    const dateMatch = firstCell.match(datePattern);
+    const dateMatch = firstCell.match(WEEK_DATE_PATTERN);
     
     if (!dateMatch) continue; // Not a valid week row
     
@@ -210,11 +206,17 @@ function parseTsvForAssignments(tsvData) {
     if (isNaN(mondayDate.getTime())) continue; // Invalid date
     
     mondayDate.setHours(0, 0, 0, 0);
-    logToRenderer(`Processing week ${weekCount}: ${mondayDate.toLocaleDateString()}`, 'info');
     
     // Process Mon-Fri (cells 1-5, since cell 0 is the date)
     const weekdayNames = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'];
     
+    // Per-day notes for this week, logged as a single line once the week is done
+    const weekLog = [];
+    const logWeek = () => {
+      const days = weekLog.map(dayLog => dayLog.join(' -> ')).join(' | ');
+      logToRenderer(`Processed week ${weekCount} (${mondayDate.toLocaleDateString()}): ${days}`, 'info');
+    };
+    
     for (let dayIndex = 0; dayIndex < 5 && dayIndex + 1 < cells.length; dayIndex++) {
       const cellContent = cells[dayIndex + 1].trim();
       
@@ -224,6 +226,7 @@ function parseTsvForAssignments(tsvData) {
       
       // Stop processing if we've gone more than 3 weeks into the future
       if (cellDate > futureCutoffDate) {
+        logWeek();
         logToRenderer(`Stopping processing: reached date ${cellDate.toLocaleDateString()} which is beyond 3-week cutoff`, 'info');
         return assignments;
       }
@@ -231,7 +234,8 @@ function parseTsvForAssignments(tsvData) {
       // Don't skip past dates anymore - we need to process them to find homework assignments
       // but we'll filter by due date later
       
-      logToRenderer(`  ${weekdayNames[dayIndex]} (${cellDate.toLocaleDateString()}): "${cellContent}"`, 'info');
+      const dayLog = [`${weekdayNames[dayIndex]} (${cellDate.toLocaleDateString()}): "${cellContent}"`];
+      weekLog.push(dayLog);
       
       // Check if this is a valid class day
       const isNoClass = cellContent === '' || 
@@ -239,18 +243,18 @@ function parseTsvForAssignments(tsvData) {
                        cellContent.includes('School Closed');
       
       if (isNoClass) {
-        logToRenderer(`    -> No class`, 'info');
+        dayLog.push('No class');
         continue;
       }
       
       // Check if it's just a section number (class meets but no assignment yet)
-      const isSectionOnly = /^\d+-\d+$|^\d+\.\d+$/.test(cellContent);
+      const isSectionOnly = SECTION_ONLY_PATTERN.test(cellContent);
       
       // This is a valid class day
       // If we have a pending homework, assign it to this date
       if (pendingHw) {
         const dueDate = new Date(cellDate);
-        logToRenderer(`    -> Assigning pending HW "${pendingHw.name}" due ${dueDate.toLocaleDateString()}`, 'info');
+        dayLog.push(`Assigning pending HW "${pendingHw.name}" due ${dueDate.toLocaleDateString()}`);
         
         // Only add if due date is within acceptable range (not more than 3 days past)
         if (dueDate >= cutoffDate) {
@@ -263,21 +267,21 @@ function parseTsvForAssignments(tsvData) {
             pendingHw.max_points
           );
           assignments.push(assignment);
-          logToRenderer(`    -> HW added (due date is within range)`, 'info');
+          dayLog.push('HW added (due date is within range)');
         } else {
-          logToRenderer(`    -> HW skipped (due date too old: ${dueDate.toLocaleDateString()})`, 'info');
+          dayLog.push(`HW skipped (due date too old: ${dueDate.toLocaleDateString()})`);
         }
         pendingHw = null;
       }
       
       if (isSectionOnly) {
-        logToRenderer(`    -> Section only (${cellContent})`, 'info');
+        dayLog.push(`Section only (${cellContent})`);
         continue;
       }
       
       // Check for TEST
       if (cellContent.toUpperCase().includes('TEST')) {
-        logToRenderer(`    -> Found TEST`, 'info');
+        dayLog.push('Found TEST');
         const assignment = createAssignmentObject(
           'Geometry Test',
           courseName,
@@ -290,15 +294,15 @@ function parseTsvForAssignments(tsvData) {
       }
       
       // Check for HW
-      const hwMatch = cellContent.match(/HW.*/i);
+      const hwMatch = cellContent.match(HOMEWORK_PATTERN);
       if (hwMatch) {
-        logToRenderer(`    -> Found HW: "${hwMatch[0]}"`, 'info');
+        dayLog.push(`Found HW: "${hwMatch[0]}"`);
         
         // Check if there's a "due" date specified in the homework text
         const explicitDueDate = extractDueDate(hwMatch[0]);
         
         if (explicitDueDate) {
-          logToRenderer(`    -> HW has explicit due date: ${explicitDueDate.toLocaleDateString()}`, 'info');
+          dayLog.push(`HW has explicit due date: ${explicitDueDate.toLocaleDateString()}`);
           // Homework has explicit due date, add it if within cutoff range
           if (explicitDueDate >= cutoffDate) {
             const assignment = createAssignmentObject(
@@ -310,12 +314,12 @@ function parseTsvForAssignments(tsvData) {
               0
             );
             assignments.push(assignment);
-            logToRenderer(`    -> HW added (explicit due date is within range)`, 'info');
+            dayLog.push('HW added (explicit due date is within range)');
           } else {
-            logToRenderer(`    -> HW skipped (explicit due date too old: ${explicitDueDate.toLocaleDateString()})`, 'info');
+            dayLog.push(`HW skipped (explicit due date too old: ${explicitDueDate.toLocaleDateString()})`);
           }
         } else {
-          logToRenderer(`    -> HW pending, waiting for next class date`, 'info');
+          dayLog.push('HW pending, waiting for next class date');
           // Create pending homework assignment (due date will be set when we find next class)
           pendingHw = {
             name: hwMatch[0],
@@ -327,6 +331,8 @@ function parseTsvForAssignments(tsvData) {
         }
       }
     }
+    
+    logWeek();
   }
   
   // If there's still a pending homework at the end of all data, log a warning
@@ -366,8 +372,8 @@ async function scrapeGoogleSheets(browserView) {
     // Check for cancellation before parsing
     checkScrapingCanceled();
 
-    // Parse the data.
-    const assignments = parseTsvForAssignments(tsvData);
+    // Parse the data (returned in due date order, like the other scrapers)
+    const assignments = sortAssignmentsByDate(parseTsvForAssignments(tsvData));
 
     return { success: true, assignments };
 
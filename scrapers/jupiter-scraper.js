@@ -1,16 +1,12 @@
 const { logToRenderer } = require('core/logger');
-const { createAssignmentObject } = require('scrapers/assignment-utils');
+const { createAssignmentObject, sortAssignmentsByDate, checkScrapingCanceled, waitForSelector, setResourceBlocking, writeFileAtomic } = require('scrapers/assignment-utils');
 const { JUPITER_CONFIG_PATH } = require('config/constants');
 const fs = require('fs');
 const path = require('path');
 
-// Helper function to check if scraping has been canceled
-function checkScrapingCanceled() {
-  // Access the global cancellation flag from main process
-  if (global.isScrapingCanceled && global.isScrapingCanceled()) {
-    throw new Error('Scraping canceled by user');
-  }
-}
+// Elements that mark a Jupiter page as ready to scrape once its navigation finishes
+const JUPITER_TODO_READY_SELECTOR = '.classbox tr.hi';
+const JUPITER_CLASS_READY_SELECTOR = 'table tr';
 
 // Load Jupiter classes configuration
 function loadJupiterClassesConfig() {
@@ -18,8 +14,6 @@ function loadJupiterClassesConfig() {
     const configData = fs.readFileSync(JUPITER_CONFIG_PATH, 'utf8');
     const config = JSON.parse(configData);
     
-    logToRenderer(`[Jupiter] Raw config loaded: ${JSON.stringify(config)}`, 'info');
-    
     // Filter out metadata fields and return only class selections
     const classSelections = {};
     for (const [key, value] of Object.entries(config)) {
@@ -28,7 +22,8 @@ function loadJupiterClassesConfig() {
       }
     }
     
-    logToRenderer(`[Jupiter] Filtered class selections: ${JSON.stringify(classSelections)}`, 'info');
+    const selectedCount = Object.values(classSelections).filter(value => value === 'selected').length;
+    logToRenderer(`[Jupiter] Loaded class selections: ${selectedCount} of ${Object.keys(classSelections).length} classes selected`, 'info');
     
     return classSelections;
   } catch (error) {
@@ -38,14 +33,16 @@ function loadJupiterClassesConfig() {
 }
 
 // Save all available classes to config, preserving existing selections
-function saveAvailableClassesToConfig(availableClasses) {
+async function saveAvailableClassesToConfig(availableClasses) {
   try {
     let config = {};
     
     // Load existing config if it exists
-    if (fs.existsSync(JUPITER_CONFIG_PATH)) {
+    try {
       const configData = fs.readFileSync(JUPITER_CONFIG_PATH, 'utf8');
       config = JSON.parse(configData);
+    } catch (error) {
+      if (error.code !== 'ENOENT') throw error;
     }
     
     // Get existing selections
@@ -59,14 +56,22 @@ function saveAvailableClassesToConfig(availableClasses) {
       allClasses[className] = existingSelections[className] || "selected";
     });
     
+    const selectedCount = Object.values(allClasses).filter(status => status === "selected").length;
+    
+    // Nothing to write when every available class is already in the config
+    const hasNewClasses = Object.keys(allClasses).some(className => config[className] !== allClasses[className]);
+    if (!hasNewClasses) {
+      logToRenderer(`[Jupiter] Config already lists all ${availableClasses.length} available classes (${selectedCount} selected)`, 'info');
+      return allClasses;
+    }
+    
     // Update config - save directly as the root object
     Object.assign(config, allClasses);
     config.last_updated = new Date().toISOString();
     
-    // Save config
-    fs.writeFileSync(JUPITER_CONFIG_PATH, JSON.stringify(config, null, 2));
+    // Save config (kept indented since it's a user-editable selection file)
+    await writeFileAtomic(JUPITER_CONFIG_PATH, JSON.stringify(config, null, 2));
     
-    const selectedCount = Object.values(allClasses).filter(status => status === "selected").length;
     logToRenderer(`[Jupiter] Updated config with ${availableClasses.length} available classes (${selectedCount} selected)`, 'info');
     
     return allClasses;
@@ -89,6 +94,10 @@ function filterSelectedClasses(availableClasses, selectedClasses) {
 async function scrapeJupiterAssignments(browserView) {
   logToRenderer('[Jupiter] Starting assignment scraping...', 'info');
   
+  // Only DOM text and attributes are read (green dots are matched by src),
+  // so skip images/fonts/media on every class page load
+  setResourceBlocking(browserView.webContents, true);
+  
   try {
     // Assume we're already logged in from the access module
     // Get list of available classes from To Do page (this will navigate to To Do page)
@@ -125,16 +134,9 @@ async function scrapeJupiterAssignments(browserView) {
       const assignments = await scrapeCurrentClassAssignments(browserView, classInfo.name);
       allAssignments.push(...assignments);
       
-      logToRenderer(`[Jupiter] Found ${assignments.length} assignments in ${classInfo.name}`, 'info');
-      
-      // Check for cancellation after scraping
+      // Check for cancellation after scraping. No trip back to the To Do page:
+      // navigateToClass goes straight to the next class via its click handler
       checkScrapingCanceled();
-      
-      // Navigate back to To Do page
-      const backSuccess = await navigateToTodoPage(browserView);
-      if (!backSuccess) {
-        logToRenderer(`[Jupiter] Warning: Could not return to To Do page after ${classInfo.name}`, 'warn');
-      }
     }
     
     logToRenderer(`[Jupiter] Total assignments found: ${allAssignments.length}`, 'success');
@@ -143,18 +145,36 @@ async function scrapeJupiterAssignments(browserView) {
   } catch (error) {
     logToRenderer(`[Jupiter] Error scraping assignments: ${error.message}`, 'error');
     return { success: false, error: error.message, assignments: [] };
+  } finally {
+    setResourceBlocking(browserView.webContents, false);
   }
 }
 
-async function waitForPageLoad(browserView, timeout = 5000) {
-  return new Promise((resolve) => {
-    const timer = setTimeout(resolve, timeout);
-    
-    browserView.webContents.once('did-finish-load', () => {
+/**
+ * Wait for a Jupiter navigation's DOM to be ready and for the next page's content to exist
+ * @param {BrowserView} browserView - The Electron BrowserView instance
+ * @param {string} readySelector - Selector that marks the new page as usable
+ * @param {number} timeout - Maximum time to wait in milliseconds
+ * @returns {Promise<boolean>} - True if a page loaded and the ready selector appeared before the timeout
+ */
+async function waitForPageLoad(browserView, readySelector, timeout = 5000) {
+  const startTime = Date.now();
+  const loaded = await new Promise((resolve) => {
+    const done = (didLoad) => {
       clearTimeout(timer);
-      setTimeout(resolve, 500); // Reduced wait for Jupiter's slow loading
-    });
+      browserView.webContents.removeListener('dom-ready', onReady);
+      resolve(didLoad);
+    };
+    const onReady = () => done(true);
+    const timer = setTimeout(() => done(false), timeout);
+    browserView.webContents.once('dom-ready', onReady);
   });
+  
+  // Without a new page the ready selector could match the page we came from
+  if (!loaded) return false;
+  
+  const remaining = Math.max(timeout - (Date.now() - startTime), 0);
+  return waitForSelector(browserView.webContents, readySelector, remaining);
 }
 
 async function findTodoButton(browserView) {
@@ -209,7 +229,7 @@ async function navigateToTodoPage(browserView) {
     if (!found) return false;
     
     await clickTodoButton(browserView);
-    await waitForPageLoad(browserView);
+    await waitForPageLoad(browserView, JUPITER_TODO_READY_SELECTOR);
     
     logToRenderer('[Jupiter] ToDo navigation complete', 'success');
     return true;
@@ -238,40 +258,23 @@ async function getAvailableJupiterClasses(browserView) {
             try {
               const classes = [];
               
-              // Find all class boxes
-              const classBoxes = document.querySelectorAll('.classbox');
-              console.log('Found', classBoxes.length, 'class boxes');
+              // All class rows across every class box, in one query
+              const classRows = document.querySelectorAll('.classbox tr.hi');
+              console.log('Found', classRows.length, 'class rows');
               
-              for (const box of classBoxes) {
+              for (const row of classRows) {
                 try {
-                  // Look for class rows within this classbox
-                  const classRows = box.querySelectorAll('tr.hi');
-                  console.log('Found', classRows.length, 'class rows in this box');
+                  // Extract class name from the div with class "big wrap"
+                  const nameDiv = row.querySelector('div.big.wrap');
+                  const className = nameDiv ? nameDiv.textContent.trim() : '';
+                  if (!className) continue;
                   
-                  for (const row of classRows) {
-                    try {
-                      // Extract class name from the div with class "big wrap"
-                      const nameDiv = row.querySelector('div.big.wrap');
-                      if (nameDiv && nameDiv.textContent.trim()) {
-                        const className = nameDiv.textContent.trim();
-                        
-                        // Extract click parameters from the tr element (for navigation)
-                        const clickAttr = row.getAttribute('click');
-                        
-                        classes.push({
-                          name: className,
-                          clickAttr: clickAttr,
-                          element: row
-                        });
-                        
-                        console.log('Found class:', className, 'click attr:', clickAttr);
-                      }
-                    } catch (e) {
-                      console.warn('Error processing class row:', e);
-                    }
-                  }
+                  // Extract click parameters from the tr element (for navigation).
+                  // DOM elements can't cross executeJavaScript, so only plain data is returned
+                  const clickAttr = row.getAttribute('click');
+                  classes.push({ name: className, clickAttr: clickAttr });
                 } catch (e) {
-                  console.warn('Error processing class box:', e);
+                  console.warn('Error processing class row:', e);
                 }
               }
               
@@ -287,7 +290,7 @@ async function getAvailableJupiterClasses(browserView) {
     logToRenderer(`[Jupiter] Discovered ${classes.length} available classes`, 'info');
     
     // Save all available classes to config
-    saveAvailableClassesToConfig(classes);
+    await saveAvailableClassesToConfig(classes);
     
     resolve(classes);
       } catch (error) {
@@ -301,10 +304,46 @@ async function getAvailableJupiterClasses(browserView) {
   }
 }
 
+// True when the current page is this class's page: not the To Do list (which
+// names every class) and showing the class name. Anything else - an error page,
+// To Do, or a different class - must not be scraped under this class's name
+async function isOnClassPage(browserView, classInfo) {
+  return browserView.webContents.executeJavaScript(`
+    !document.querySelector(${JSON.stringify(JUPITER_TODO_READY_SELECTOR)}) &&
+      !!document.body && document.body.innerText.includes(${JSON.stringify(classInfo.name)})
+  `);
+}
+
+// Run a class's saved click handler (like "gogrades(5768947,4)") on the current
+// page and wait for the class page, without looking its row up on the To Do page
+async function navigateToClassDirect(browserView, classInfo) {
+  try {
+    await browserView.webContents.executeJavaScript(`(function () { ${classInfo.clickAttr}; })()`);
+    if (!(await waitForPageLoad(browserView, JUPITER_CLASS_READY_SELECTOR))) return false;
+    return await isOnClassPage(browserView, classInfo);
+  } catch (error) {
+    return false;
+  }
+}
+
 async function navigateToClass(browserView, classInfo) {
   try {
     logToRenderer(`[Jupiter] Navigating to class: ${classInfo.name}`, 'info');
     
+    if (classInfo.clickAttr && await navigateToClassDirect(browserView, classInfo)) {
+      logToRenderer(`[Jupiter] Opened class directly: ${classInfo.name} (${classInfo.clickAttr})`, 'info');
+      return true;
+    }
+    
+    // Fall back to finding the row by name, which needs the To Do page
+    const onTodoPage = await browserView.webContents.executeJavaScript(
+      `!!document.querySelector(${JSON.stringify(JUPITER_TODO_READY_SELECTOR)})`
+    );
+    if (!onTodoPage && !(await navigateToTodoPage(browserView))) {
+      logToRenderer(`[Jupiter] Could not return to To Do page for ${classInfo.name}`, 'warn');
+      return false;
+    }
+    
     return new Promise(async (resolve, reject) => {
       try {
         const clicked = await browserView.webContents.executeJavaScript(`
@@ -318,8 +357,8 @@ async function navigateToClass(browserView, classInfo) {
                 
                 for (const row of classRows) {
                   const nameDiv = row.querySelector('div.big.wrap');
-                  if (nameDiv && nameDiv.textContent.trim() === '${classInfo.name.replace(/'/g, "\\'")}') {
-                    console.log('Found class row for:', '${classInfo.name.replace(/'/g, "\\'")}');
+                  if (nameDiv && nameDiv.textContent.trim() === ${JSON.stringify(classInfo.name)}) {
+                    console.log('Found class row for:', ${JSON.stringify(classInfo.name)});
                     
                     // Get the click attribute (like "gogrades(5768947,4)")
                     const clickAttr = row.getAttribute('click');
@@ -339,7 +378,7 @@ async function navigateToClass(browserView, classInfo) {
                 }
               }
               
-              console.warn('Class row not found for:', '${classInfo.name.replace(/'/g, "\\'")}');
+              console.warn('Class row not found for:', ${JSON.stringify(classInfo.name)});
               resolve({ success: false, clicked: false, error: 'Class row not found' });
             } catch (e) {
               console.error('Error in class navigation:', e);
@@ -350,7 +389,7 @@ async function navigateToClass(browserView, classInfo) {
         
         if (clicked.success) {
           logToRenderer(`[Jupiter] Successfully executed click for class: ${classInfo.name} (${clicked.clickAttr})`, 'info');
-          await waitForPageLoad(browserView);
+          await waitForPageLoad(browserView, JUPITER_CLASS_READY_SELECTOR);
           resolve(true);
         } else {
           logToRenderer(`[Jupiter] Failed to find/click class: ${classInfo.name} - ${clicked.error}`, 'warn');
@@ -377,19 +416,23 @@ async function scrapeCurrentClassAssignments(browserView, className) {
           new Promise((resolve) => {
             try {
               const assignments = [];
+              // Built once for the whole page rather than per row
+              const pointsPattern = /(\\d+)/;
               
-              // Find all TR elements that contain the green dot (incomplete assignments)
+              // Find the TR elements that contain the green dot (incomplete assignments)
               // This matches the Python XPath: //tr[td/img[contains(@src, 'dot_green.svg')]]
-              const allRows = document.querySelectorAll('tr');
+              // Start from the dots themselves rather than testing every row on the page
+              const greenDots = document.querySelectorAll('td img[src*="dot_green.svg"]');
+              const rows = new Set();
+              for (const dot of greenDots) {
+                const row = dot.closest('tr');
+                if (row) rows.add(row);
+              }
               
-              console.log('Found', allRows.length, 'total rows to check');
+              console.log('Found', rows.size, 'rows with a green dot');
               
-              for (const row of allRows) {
+              for (const row of rows) {
                 try {
-                  // Check if this row contains a green dot image
-                  const greenDot = row.querySelector('td img[src*="dot_green.svg"]');
-                  if (!greenDot) continue;
-                  
                   const cells = row.querySelectorAll('td');
                   if (cells.length < 8) continue; // Make sure we have enough cells
                   
@@ -402,21 +445,18 @@ async function scrapeCurrentClassAssignments(browserView, className) {
                   
                   // Parse max points (remove any non-numeric characters)
                   let maxPoints = 0;
-                  const pointsMatch = maxPointsText.match(/(\\d+)/);
+                  const pointsMatch = maxPointsText.match(pointsPattern);
                   if (pointsMatch) {
                     maxPoints = parseInt(pointsMatch[1], 10);
                   }
                   
                   assignments.push({
                     name: assignmentName,
-                    className: '${className.replace(/'/g, "\\'")}',
+                    className: ${JSON.stringify(className)},
                     dueDate: dueDate || 'No due date',
                     maxPoints: maxPoints,
                     url: window.location.href // Current class page URL
                   });
-                  
-                  console.log('Found assignment:', assignmentName, 'due:', dueDate, 'points:', maxPoints);
-                  
                 } catch (e) {
                   console.warn('Error processing assignment row:', e);
                 }
@@ -456,16 +496,23 @@ async function extractAssignmentDetails(browserView, assignment) {
 }
 
 async function convertToStandardFormat(rawAssignments) {
-  return rawAssignments.map(raw => 
+  // One reference time for the whole batch, so due dates shared by several
+  // assignments only need to be parsed and formatted once
+  const now = new Date();
+  const dueDateCache = new Map();
+  // Returned in due date order so results can be merged without re-sorting
+  return sortAssignmentsByDate(rawAssignments.map(raw => 
     createAssignmentObject(
       raw.name,
       raw.className,
       raw.dueDate,
       raw.url,
       raw.description || '',
-      raw.maxPoints || 0
+      raw.maxPoints || 0,
+      now,
+      dueDateCache
     )
-  );
+  ));
 }
 
 module.exports = {
@@ -4,6 +4,9 @@ const { ipcRenderer } = require('electron');
 const fs = require('fs');
 const path = require('path');
 
+// Maximum number of entries kept in the logs window
+const MAX_LOG_ENTRIES = 500;
+
 // Load existing log file on startup
 async function loadExistingLogs() {
   try {
@@ -12,7 +15,8 @@ async function loadExistingLogs() {
     
     if (fs.existsSync(logFilePath)) {
       const logContent = fs.readFileSync(logFilePath, 'utf8');
-      const lines = logContent.split('\n').filter(line => line.trim());
+      // Only the newest entries would survive the display limit, so don't build the rest
+      const lines = logContent.split('\n').filter(line => line.trim()).slice(-MAX_LOG_ENTRIES);
       
       // Clear the loading message
       const container = document.getElementById('logs-container');
@@ -64,8 +68,8 @@ function addLogEntry(message, type = 'info', timestamp = null) {
     container.scrollTop = container.scrollHeight;
   }
   
-  // Limit to last 500 entries to prevent memory issues
-  while (container.children.length > 500) {
+  // Limit to last MAX_LOG_ENTRIES entries to prevent memory issues
+  while (container.children.length > MAX_LOG_ENTRIES) {
     container.removeChild(container.firstChild);
   }
 }